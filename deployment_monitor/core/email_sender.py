@@ -3,13 +3,23 @@ Email Sender Module
 Sends deployment validation summary emails via Outlook COM
 """
 
-import win32com.client
+import sys
 import logging
 import time
 from functools import wraps
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Outlook COM is Windows-only; skip the pywin32 import elsewhere
+if sys.platform == "win32":
+    try:
+        import win32com.client
+        WIN32COM_AVAILABLE = True
+    except ImportError:
+        WIN32COM_AVAILABLE = False
+else:
+    WIN32COM_AVAILABLE = False
+
 logger = logging.getLogger("deployment_monitor.email_sender")
 
 
@@ -201,6 +211,10 @@ class EmailSender:
             logger.error("No recipients configured for email")
             return False, "No recipients configured"
 
+        if not WIN32COM_AVAILABLE:
+            logger.error("Outlook COM (pywin32) is not available on this platform")
+            return False, "Outlook COM not available on this platform"
+
         try:
             logger.info(f"Preparing to send email to {len(self.recipients)} recipients")
             
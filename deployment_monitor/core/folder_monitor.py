@@ -4,7 +4,7 @@ import os
 import logging
 import hashlib
 from pathlib import Path
-from typing import Set, Generator, List, Dict, Tuple
+from typing import Callable, Set, Generator, List, Dict, Optional, Tuple
 
 logger = logging.getLogger("deployment_monitor.folder_monitor")
 try:
@@ -15,6 +15,13 @@ try:
 except ImportError:
     WATCHDOG_AVAILABLE = False
 
+# Seconds between stop checks while waiting for files
+STOP_CHECK_INTERVAL = 0.5
+
+# Seconds a file's size and mtime must stay unchanged before it is handed
+# out, so a ZIP that is still being copied is not processed half-written
+SETTLE_SECONDS = 2.0
+
 
 class FolderMonitor:
     """
@@ -128,10 +135,54 @@ class FolderMonitor:
         
         return new_files
 
+    def _take_settled(
+        self,
+        pending: Dict[Path, Tuple[Tuple[int, float], float]],
+        now: Optional[float] = None
+    ) -> List[Path]:
+        """
+        Remove and return pending files whose fingerprint has not changed
+        for SETTLE_SECONDS. Files still changing get their timer reset;
+        files that vanished or are unchanged duplicates are dropped.
+        
+        Args:
+            pending: path -> (last seen fingerprint, monotonic time it was seen)
+            now: Current monotonic time (defaults to time.monotonic())
+            
+        Returns:
+            Files ready for processing
+        """
+        if now is None:
+            now = time.monotonic()
+
+        settled = []
+        for file, (fingerprint, since) in list(pending.items()):
+            if not file.exists():
+                del pending[file]
+                continue
+
+            current = self._get_file_fingerprint(file)
+            if current != fingerprint:
+                pending[file] = (current, now)
+                continue
+
+            if now - since < SETTLE_SECONDS:
+                continue
+
+            del pending[file]
+            if file.name in self.processed_files and self._is_duplicate(file):
+                logger.debug(f"Skipping duplicate: {file.name}")
+                continue
+            settled.append(file)
+
+        return settled
+
     def start_polling(self) -> Generator[Path, None, None]:
         """
         Start polling for new files.
         
+        Blocks in time.sleep(poll_interval) between scans; never busy-waits.
+        
         Yields:
             Path objects for new files as they are detected
         """
@@ -153,15 +204,81 @@ class FolderMonitor:
                 time.sleep(self.poll_interval)
 
 
+    def start_watching(self, is_running: Callable[[], bool]) -> Generator[Path, None, None]:
+        """
+        Watch for new files using filesystem events, falling back to polling.
+        
+        Watchdog events (plus a catch-up scan of files already present) feed
+        a queue that is consumed with a short blocking timeout, so the thread
+        sleeps while idle and notices is_running() turning False promptly.
+        A file is yielded once its size and mtime have been stable for
+        SETTLE_SECONDS.
+        
+        Args:
+            is_running: Callable checked between events; watching stops when it returns False
+            
+        Yields:
+            Path objects for new or modified files
+        """
+        if not WATCHDOG_AVAILABLE:
+            logger.info("watchdog not installed, falling back to polling")
+            while is_running():
+                for file in self.scan_for_new_files():
+                    yield file
+                # Block in short slices so a stop is noticed within STOP_CHECK_INTERVAL
+                deadline = time.monotonic() + self.poll_interval
+                while is_running() and time.monotonic() < deadline:
+                    time.sleep(STOP_CHECK_INTERVAL)
+            return
+
+        file_queue = queue.Queue()
+
+        # Handler gets its own empty set: modified re-drops must still reach
+        # the duplicate check instead of being filtered by name
+        observer = Observer()
+        observer.schedule(
+            NewFileHandler(file_queue, set(), watch_modified=True),
+            str(self.incoming_path),
+            recursive=False
+        )
+        observer.start()
+        logger.info(f"Event Folder Monitor Started (Watchdog): {self.incoming_path}")
+
+        # Catch-up scan only after the observer runs, so a file dropped in
+        # between is not missed; a file seen twice is merged in `pending`
+        for file in self.scan_for_new_files():
+            file_queue.put(file)
+
+        pending: Dict[Path, Tuple[Tuple[int, float], float]] = {}
+
+        try:
+            while is_running():
+                try:
+                    file = file_queue.get(timeout=STOP_CHECK_INTERVAL)
+                    if file.parent == self.incoming_path and file.exists():
+                        # Every event restarts the settle window
+                        pending[file] = (self._get_file_fingerprint(file), time.monotonic())
+                except queue.Empty:
+                    pass
+
+                for file in self._take_settled(pending):
+                    logger.debug(f"File event detected: {file.name}")
+                    yield file
+        finally:
+            observer.stop()
+            observer.join()
+            logger.debug("Watchdog observer stopped")
+
 # ==========================================================
 # RETAINED WATCHDOG CODE (FOR FUTURE USE)
 # ==========================================================
 
 if WATCHDOG_AVAILABLE:
     class NewFileHandler(FileSystemEventHandler):
-        def __init__(self, file_queue, processed_files):
+        def __init__(self, file_queue, processed_files, watch_modified=False):
             self.file_queue = file_queue
             self.processed_files = processed_files
+            self.watch_modified = watch_modified
             
         def on_created(self, event):
             if not event.is_directory:
@@ -169,6 +286,11 @@ if WATCHDOG_AVAILABLE:
                 if path.suffix.lower() in [".zip", ".msg"] and path.name not in self.processed_files:
                     self.file_queue.put(path)
 
+        def on_modified(self, event):
+            # In-place overwrites (re-drops) raise only modified events
+            if self.watch_modified:
+                self.on_created(event)
+
         def on_moved(self, event):
             if not event.is_directory:
                 path = Path(event.dest_path)
@@ -1,7 +1,15 @@
 import re
+import mmap
 import logging
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Union
+
+try:
+    import re2 as regex_engine  # google-re2: linear-time DFA matching
+    RE2_AVAILABLE = True
+except ImportError:
+    regex_engine = re
+    RE2_AVAILABLE = False
 
 logger = logging.getLogger("deployment_monitor.jira_extractor")
 
@@ -13,6 +21,10 @@ class JiraExtractor:
 
     JIRA_PATTERN = re.compile(r"\b[A-Z]+-\d+\b")
     EXECUTION_START_PATTERN = re.compile(r"- execution start", re.IGNORECASE)
+    UNIT_MARKER_PATTERN = re.compile(r" - execution", re.IGNORECASE)
+    # Byte-level prefilter: any line holding a JIRA key or an execution start
+    # contains one of these; all other lines are skipped without decoding
+    CANDIDATE_PATTERN = regex_engine.compile(rb"[A-Z]-[0-9]|(?i:- execution start)")
 
     def __init__(self, main_log_path: Path):
         try:
@@ -44,21 +56,44 @@ class JiraExtractor:
             jira_unit_map: Dict[str, Set[str]] = {}
             current_jira: Optional[str] = None
 
-            with open(self.main_log_path, "r", errors="ignore") as f:
-                for line in f:
-                    # Detect JIRA
-                    jira_match = self.JIRA_PATTERN.search(line)
-                    if jira_match:
-                        current_jira = jira_match.group(0).upper()
-                        if current_jira not in jira_unit_map:
-                            jira_unit_map[current_jira] = set()
-
-                    # Detect Execution Start
-                    if self.EXECUTION_START_PATTERN.search(line):
-                        unit = self._extract_unit_from_line(line)
-
-                        if unit is not None and current_jira is not None:
-                            jira_unit_map[current_jira].add(unit)
+            with open(self.main_log_path, "rb") as f:
+                try:
+                    buf: Union[mmap.mmap, bytes] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Empty file, or mapping not supported for this file
+                    buf = f.read()
+
+                try:
+                    pos = 0
+                    end = len(buf)
+                    while pos < end:
+                        match = self.CANDIDATE_PATTERN.search(buf, pos)
+                        if match is None:
+                            break
+
+                        line_start = buf.rfind(b"\n", 0, match.start()) + 1
+                        line_end = buf.find(b"\n", match.end())
+                        if line_end == -1:
+                            line_end = end
+                        line = buf[line_start:line_end].decode("utf-8", errors="ignore")
+                        pos = line_end + 1
+
+                        # Detect JIRA
+                        jira_match = self.JIRA_PATTERN.search(line)
+                        if jira_match:
+                            current_jira = jira_match.group(0).upper()
+                            if current_jira not in jira_unit_map:
+                                jira_unit_map[current_jira] = set()
+
+                        # Detect Execution Start
+                        if self.EXECUTION_START_PATTERN.search(line):
+                            unit = self._extract_unit_from_line(line)
+
+                            if unit is not None and current_jira is not None:
+                                jira_unit_map[current_jira].add(unit)
+                finally:
+                    if isinstance(buf, mmap.mmap):
+                        buf.close()
 
             # Convert sets to sorted lists
             final_map: Dict[str, List[str]] = {
@@ -88,15 +123,14 @@ class JiraExtractor:
         .../EG1_EGYPT_ISO_BRNPRM.INC - execution start
         """
 
-        marker = " - execution"
-        marker_index = line.lower().find(marker)
+        marker = JiraExtractor.UNIT_MARKER_PATTERN.search(line)
 
-        if marker_index == -1:
+        if marker is None:
             return None
 
-        path_part = line[:marker_index].strip()
+        path_part = line[:marker.start()].strip()
 
         # Split using both Unix and Windows separators safely
-        unit = Path(path_part).name
+        unit = path_part.replace("\\", "/").rpartition("/")[2]
 
         return unit if unit else None
@@ -12,11 +12,14 @@ class Notifier:
     """
 
     def __init__(self):
-        self.stop_sound = False
+        self._stop_sound = threading.Event()
 
     def _play_sound(self):
-        while not self.stop_sound:
+        while not self._stop_sound.is_set():
             winsound.Beep(1000, 700)
+            # Re-check between tones so acknowledging stops after one beep
+            if self._stop_sound.is_set():
+                break
             winsound.Beep(1500, 700)
 
     def notify(self, message: str):
@@ -28,7 +31,7 @@ class Notifier:
         """
         try:
             logger.info(f"Sending notification to user")
-            self.stop_sound = False
+            self._stop_sound.clear()
 
             sound_thread = threading.Thread(target=self._play_sound)
             sound_thread.daemon = True
@@ -44,7 +47,7 @@ class Notifier:
 
             def acknowledge():
                 logger.debug("User acknowledged notification")
-                self.stop_sound = True
+                self._stop_sound.set()
                 root.destroy()
 
             button = tk.Button(root, text="Acknowledge", command=acknowledge)
@@ -1,9 +1,97 @@
+import io
 import re
+import sys
+import mmap
 import logging
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import compress
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import IO, BinaryIO, List, Deque, Dict, Iterator, Optional, Tuple, Union
 
 logger = logging.getLogger("deployment_monitor.validator")
+try:
+    import re2 as regex_engine  # google-re2: linear-time DFA matching
+    RE2_AVAILABLE = True
+except ImportError:
+    regex_engine = re
+    RE2_AVAILABLE = False
+
+READ_BUFFER_SIZE = 1 << 20  # Buffered fallback when a log can't be memory-mapped
+
+# Logs are scanned as raw bytes; only stored values are decoded.
+# Inline (?i) keeps the pattern portable between re2 and the stdlib engine
+ERROR_PATTERN = regex_engine.compile(rb"(?i)(ORA-\d+|PLS-\d+|compilation errors)")
+
+# Invalid object listing: SCHEMA_NAME.OBJECT_NAME (TYPE) or just OBJECT_NAME
+INVALID_OBJECT_PATTERN = re.compile(rb"^.*?([A-Z_][A-Z0-9_]*\.[A-Z_][A-Z0-9_]*|[A-Z_][A-Z0-9_]*)\s*(?:\(([^)]+)\))?", re.IGNORECASE)
+DIGITS_PATTERN = re.compile(rb"\d+")
+
+# main_log carries both error codes and execution markers; one alternation
+# finds both in a single pass and the "phase" group (2) tells them apart.
+# Looked up by index: re2 keys the group names of bytes patterns as bytes
+MAIN_LOG_PATTERN = regex_engine.compile(
+    rb"(?i)(?P<error>ORA-\d+|PLS-\d+|compilation errors)|execution (?P<phase>start|end)"
+)
+
+UNIT_MARKER_PATTERN = regex_engine.compile(rb"(?i) - execution")
+UNIT_LOOKBACK_LINES = 20  # How far above an error to look for the unit being compiled
+
+LogSource = Union[Path, IO]
+
+# codes, messages, units, files, keep - one list per error field
+ErrorColumns = Tuple[List[str], List[Optional[str]], List[Optional[str]], List[str], List[bool]]
+
+
+def _map_log(f) -> mmap.mmap:
+    """
+    Memory-map an open log read-only. Where the platform supports it the
+    kernel is told the mapping is read front to back, so it reads ahead
+    in large blocks instead of faulting pages in one by one.
+    """
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return mm
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="ignore")
+
+
+def _open_log(source: LogSource) -> BinaryIO:
+    """
+    Open a log for binary reading. Besides paths, file-like objects
+    (e.g. io.StringIO / io.BytesIO fixtures) are accepted; they are read
+    from the start and, if they hold text, encoded as UTF-8.
+    """
+    if not hasattr(source, "read"):
+        return open(source, "rb", buffering=READ_BUFFER_SIZE)
+
+    if hasattr(source, "seek"):
+        source.seek(0)
+    data = source.read()
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return io.BytesIO(data)
+
+
+def _log_name(source: LogSource) -> str:
+    if hasattr(source, "read"):
+        return getattr(source, "name", "<stream>")
+    return Path(source).name
+
+
+@lru_cache(maxsize=4096)
+def _basename(path: bytes) -> str:
+    """
+    Decoded last component of a Unix or Windows style path.
+    Cached because each unit shows up on both its start and end lines.
+    """
+    sep_index = max(path.rfind(b"/"), path.rfind(b"\\"))
+    return _decode(path[sep_index + 1:])
 
 
 class DeploymentValidator:
@@ -12,85 +100,277 @@ class DeploymentValidator:
         self.metadata = metadata
         self.config = config
 
-        self.main_log_path: Path = metadata["main_log_path"]
-        self.invalid_log_path: Path = metadata["invalid_log_path"]
-        self.error_log_path: Optional[Path] = metadata["error_log_path"]
+        # Paths, or file-like objects holding the log contents
+        self.main_log_path: LogSource = metadata["main_log_path"]
+        self.invalid_log_path: LogSource = metadata["invalid_log_path"]
+        self.error_log_path: Optional[LogSource] = metadata["error_log_path"]
+
+        # Interned so scanned codes compare against these by identity first
+        self.ignorable_errors = frozenset(sys.intern(code.upper()) for code in config.get("ignorable_errors", []))
+
+        # Error rows are kept column-wise (one list per field) and only
+        # turned into dicts when error_details is read
+        self._error_codes: List[str] = []
+        self._error_messages: List[Optional[str]] = []  # None for ignorable rows
+        self._error_units: List[Optional[str]] = []
+        self._error_files: List[str] = []
+        self._error_keep: List[bool] = []  # False for ignorable rows, set at scan time
+
+        # Filled by the single main_log pass shared by the error and execution checks.
+        # Multisets, so a unit started twice but ended once is caught
+        self._main_log_scanned: bool = False
+        self._main_log_lock = threading.Lock()  # The error and execution checks may run concurrently
+        self._execution_start: Counter = Counter()
+        self._execution_end: Counter = Counter()
 
-        self.ignorable_errors = set(config.get("ignorable_errors", []))
-
-        self.detected_errors: List[str] = []
-        self.filtered_errors: List[str] = []
-        self.error_details: List[Dict] = []  # Store detailed error info
         self.invalid_objects: List[Dict] = []  # Store newly created invalid objects
 
         self.invalid_mismatch: bool = False
         self.execution_mismatch: bool = False
 
+    def _error_columns(self) -> ErrorColumns:
+        return self._error_codes, self._error_messages, self._error_units, self._error_files, self._error_keep
+
+    @property
+    def detected_errors(self) -> List[str]:
+        """All error codes found in the logs, including ignorable ones."""
+        return list(self._error_codes)
+
+    @property
+    def filtered_errors(self) -> List[str]:
+        """Error codes that are not configured as ignorable."""
+        if not self.ignorable_errors:
+            # Nothing to filter out - every detected error counts
+            return list(self._error_codes)
+        return list(compress(self._error_codes, self._error_keep))
+
+    @property
+    def error_details(self) -> List[Dict]:
+        """Detailed info (code, message, unit, file) for non-ignorable errors."""
+        return [
+            {"code": code, "message": message, "unit": unit, "file": file_name}
+            for code, message, unit, file_name in compress(
+                zip(self._error_codes, self._error_messages, self._error_units, self._error_files),
+                self._error_keep
+            )
+        ]
+
+    @staticmethod
+    def _iter_lines(file_path: LogSource) -> Iterator[bytes]:
+        """
+        Yield the raw lines of a log file without loading the whole file.
+        Regular files are memory-mapped; empty files, pipes and anything else
+        mmap rejects are read through a 1 MiB buffered binary reader.
+        """
+        with _open_log(file_path) as f:
+            try:
+                mm = _map_log(f)
+            except (ValueError, OSError):
+                mm = None
+
+            if mm is None:
+                yield from iter(f.readline, b"")
+                return
+
+            with mm:
+                yield from iter(mm.readline, b"")
+
     # ==========================================================
     # 1️⃣ ERROR VALIDATION
     # ==========================================================
 
-    @staticmethod
-    def _extract_errors_from_file(file_path: Path) -> List[Dict]:
-        """Extract error details from log file with code, message, unit context."""
-        errors: List[Dict] = []
-        pattern = re.compile(r"(ORA-\d+|PLS-\d+|compilation errors)", re.IGNORECASE)
-
-        with open(file_path, "r", errors="ignore") as f:
-            lines = f.readlines()
-
-        for idx, line in enumerate(lines):
-            match = pattern.search(line)
-            if match:
-                error_code = match.group(0).upper()
-                unit_name = None
-                
-                # Look backward to find the unit/object being compiled
-                for back_idx in range(idx - 1, max(0, idx - 20), -1):
-                    back_line = lines[back_idx]
-                    unit = DeploymentValidator._extract_unit_from_line(back_line)
+    def _extract_errors_from_file(self, file_path: LogSource, track_execution: bool = False,
+                                  columns: Optional[ErrorColumns] = None) -> int:
+        """
+        Extract error code, message and unit context from a log file into the error columns
+        (or into the given columns, for a scan running alongside another one).
+        With track_execution, the same file mapping is also used to count execution start/end units.
+        """
+        with _open_log(file_path) as f:
+            try:
+                mm = _map_log(f)
+            except (ValueError, OSError):
+                # Empty files and pipes can't be mapped
+                return self._scan_log_stream(f, _log_name(file_path), track_execution, columns)
+
+            try:
+                return self._scan_log_buffer(mm, _log_name(file_path), track_execution, columns)
+            finally:
+                mm.close()
+
+    def _scan_log_buffer(self, buf, file_name: str, track_execution: bool,
+                         columns: Optional[ErrorColumns] = None) -> int:
+        """
+        Run the error (and optionally execution marker) patterns over a whole
+        log buffer (bytes or mmap). Only the lines around a match are sliced out.
+        """
+        found = 0
+        codes, messages, units, files, keep = columns if columns is not None else self._error_columns()
+        ignorable = self.ignorable_errors
+        execution_start = self._execution_start
+        execution_end = self._execution_end
+        last_execution_line = -1
+
+        pattern = MAIN_LOG_PATTERN if track_execution else ERROR_PATTERN
+        for match in pattern.finditer(buf):
+            line_start = buf.rfind(b"\n", 0, match.start()) + 1
+            line_end = buf.find(b"\n", match.end())
+            if line_end == -1:
+                line_end = len(buf)
+
+            phase = match.group(2) if track_execution else None
+            if phase is not None:
+                if line_start == last_execution_line:
+                    continue  # Only the first marker on a line counts
+                last_execution_line = line_start
+
+                unit = self._extract_unit_from_line(buf[line_start:line_end])
+                if unit:
+                    if phase.lower() == b"start":
+                        execution_start[unit] += 1
+                    else:
+                        execution_end[unit] += 1
+                continue
+
+            # Codes repeat heavily across a log; intern so rows share one string
+            error_code = sys.intern(_decode(match.group(0)).upper())
+            codes.append(error_code)
+            files.append(file_name)
+            found += 1
+
+            if error_code in ignorable:
+                # Never reported in error_details - skip the message and unit lookup
+                messages.append(None)
+                units.append(None)
+                keep.append(False)
+                continue
+
+            unit_name = self._find_unit_before(buf, line_start)
+            messages.append(_decode(buf[line_start:line_end].strip()))
+            units.append(unit_name or "Unknown Unit")
+            keep.append(True)
+
+        return found
+
+    def _scan_log_stream(self, f, file_name: str, track_execution: bool,
+                         columns: Optional[ErrorColumns] = None) -> int:
+        """
+        Line-by-line counterpart of _scan_log_buffer for logs that can't be mapped.
+        Only the last UNIT_LOOKBACK_LINES lines are held for the unit lookup.
+        """
+        found = 0
+        recent: Deque[bytes] = deque(maxlen=UNIT_LOOKBACK_LINES)
+        codes, messages, units, files, keep = columns if columns is not None else self._error_columns()
+        ignorable = self.ignorable_errors
+        execution_start = self._execution_start
+        execution_end = self._execution_end
+
+        pattern = MAIN_LOG_PATTERN if track_execution else ERROR_PATTERN
+        for line in iter(f.readline, b""):
+            line = line.rstrip(b"\r\n")
+            counted_execution = False
+
+            for match in pattern.finditer(line):
+                phase = match.group(2) if track_execution else None
+                if phase is not None:
+                    if counted_execution:
+                        continue  # Only the first marker on a line counts
+                    counted_execution = True
+
+                    unit = self._extract_unit_from_line(line)
                     if unit:
-                        unit_name = unit
+                        if phase.lower() == b"start":
+                            execution_start[unit] += 1
+                        else:
+                            execution_end[unit] += 1
+                    continue
+
+                error_code = sys.intern(_decode(match.group(0)).upper())
+                codes.append(error_code)
+                files.append(file_name)
+                found += 1
+
+                if error_code in ignorable:
+                    messages.append(None)
+                    units.append(None)
+                    keep.append(False)
+                    continue
+
+                unit_name = None
+                for previous in reversed(recent):
+                    unit_name = self._extract_unit_from_line(previous)
+                    if unit_name:
                         break
-                
-                errors.append({
-                    "code": error_code,
-                    "message": line.strip(),
-                    "unit": unit_name or "Unknown Unit",
-                    "file": file_path.name
-                })
 
-        return errors
+                messages.append(_decode(line.strip()))
+                units.append(unit_name or "Unknown Unit")
+                keep.append(True)
+
+            recent.append(line)
+
+        return found
+
+    @staticmethod
+    def _find_unit_before(buf, line_start: int) -> Optional[str]:
+        """Look over the lines preceding line_start for the unit/object being compiled."""
+        # Only newline offsets are walked to bound the lookback window;
+        # the window itself is searched for the marker in one regex call
+        window_end = line_start - 1  # Newline that terminates the previous line
+        window_start = window_end
+        for _ in range(UNIT_LOOKBACK_LINES):
+            if window_start < 0:
+                break
+            window_start = buf.rfind(b"\n", 0, window_start)
+        window_start += 1
+
+        if window_end <= window_start:
+            return None
+
+        markers = list(UNIT_MARKER_PATTERN.finditer(buf, window_start, window_end))
+        for marker in reversed(markers):
+            prev_start = buf.rfind(b"\n", 0, marker.start()) + 1
+            prev_end = buf.find(b"\n", marker.end(), window_end)
+            if prev_end == -1:
+                prev_end = window_end
+            unit = DeploymentValidator._extract_unit_from_line(buf[prev_start:prev_end])
+            if unit:
+                return unit
+        return None
+
+    def _scan_main_log(self) -> None:
+        """Read main_log once for both the error and the execution integrity checks."""
+        with self._main_log_lock:
+            if self._main_log_scanned:
+                return
+            self._extract_errors_from_file(self.main_log_path, track_execution=True)
+            self._main_log_scanned = True
 
     def validate_errors(self) -> bool:
         try:
-            # Main log errors
             logger.info("Starting error validation from logs")
-            main_errors = self._extract_errors_from_file(self.main_log_path)
-            self.detected_errors.extend([e["code"] for e in main_errors])
-            self.error_details.extend(main_errors)
 
-            # oracle_error file errors (if exists)
+            # The oracle_error file (if exists) is scanned alongside main_log into its
+            # own columns, then appended after the main_log rows to keep their order
             if self.error_log_path is not None:
-                error_log_errors = self._extract_errors_from_file(self.error_log_path)
-                self.detected_errors.extend([e["code"] for e in error_log_errors])
-                self.error_details.extend(error_log_errors)
-
-            # Remove ignorable errors
-            self.filtered_errors = [
-                err for err in self.detected_errors
-                if err not in self.ignorable_errors
-            ]
-            
-            # Also filter error_details
-            filtered_error_codes = set(self.filtered_errors)
-            self.error_details = [
-                e for e in self.error_details
-                if e["code"] in filtered_error_codes
-            ]
-            
-            logger.info(f"Error validation complete: {len(self.detected_errors)} detected, {len(self.filtered_errors)} non-ignorable")
-            return len(self.filtered_errors) == 0
+                error_log_columns: ErrorColumns = ([], [], [], [], [])
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    main_future = executor.submit(self._scan_main_log)
+                    error_future = executor.submit(
+                        self._extract_errors_from_file, self.error_log_path, False, error_log_columns
+                    )
+                main_future.result()
+                error_future.result()
+
+                for column, rows in zip(self._error_columns(), error_log_columns):
+                    column.extend(rows)
+            else:
+                self._scan_main_log()
+
+            # Ignorable rows were flagged while scanning, so no filter pass is needed
+            non_ignorable = self._error_keep.count(True)
+
+            logger.info(f"Error validation complete: {len(self._error_codes)} detected, {non_ignorable} non-ignorable")
+            return non_ignorable == 0
         
         except FileNotFoundError as e:
             logger.error(f"Log file not found: {e}")
@@ -99,47 +379,50 @@ class DeploymentValidator:
             logger.error(f"Error validating errors: {e}", exc_info=True)
             return False
 
+    @staticmethod
+    def _track_invalid_section(line: bytes, line_lower: bytes, in_invalid_section: bool,
+                               invalid_objects: List[Dict]) -> bool:
+        """
+        Advance the invalid-object section state machine by one invalid_log line,
+        appending any object listed on it. Returns whether the next line is inside the section.
+        """
+        line_stripped = line.strip()
+
+        # Detect start of invalid objects list
+        if b"invalid object" in line_lower or (b"--- " in line_stripped and b"invalid" in line_lower):
+            return True
+
+        # Detect end of section
+        if in_invalid_section and (b"---" in line_stripped or b"number of invalids" in line_lower):
+            return False
+
+        # Extract invalid objects
+        if in_invalid_section and line_stripped and not line_stripped.startswith(b"--"):
+            match = INVALID_OBJECT_PATTERN.match(line_stripped)
+            if match and match.group(1):
+                object_name = _decode(match.group(1))
+                object_type = _decode(match.group(2)) if match.group(2) else "UNKNOWN"
+
+                if len(object_name) > 2:  # Filter out short lines
+                    invalid_objects.append({
+                        "object": object_name,
+                        "type": object_type.strip(),
+                        "source": "invalid_log"
+                    })
+
+        return in_invalid_section
+
     def extract_invalid_objects(self) -> List[Dict]:
         """Extract invalid objects created during deployment."""
         try:
             logger.info("Extracting invalid objects from deployment logs")
             invalid_objects: List[Dict] = []
 
-            with open(self.invalid_log_path, "r", errors="ignore") as f:
-                lines = f.readlines()
-
-            # Pattern to match invalid object listings
-            # Typical format: SCHEMA_NAME.OBJECT_NAME (TYPE) or just OBJECT_NAME
-            pattern = re.compile(r"^.*?([A-Z_][A-Z0-9_]*\.[A-Z_][A-Z0-9_]*|[A-Z_][A-Z0-9_]*)\s*(?:\(([^)]+)\))?", re.IGNORECASE)
-
             in_invalid_section = False
-            for line in lines:
-                line_lower = line.lower()
-                line_stripped = line.strip()
-
-                # Detect start of invalid objects list
-                if "invalid object" in line_lower or ("--- " in line_stripped and "invalid" in line_lower):
-                    in_invalid_section = True
-                    continue
-
-                # Detect end of section
-                if in_invalid_section and ("---" in line_stripped or "number of invalids" in line_lower):
-                    in_invalid_section = False
-                    continue
-
-                # Extract invalid objects
-                if in_invalid_section and line_stripped and not line_stripped.startswith("--"):
-                    match = pattern.match(line_stripped)
-                    if match and match.group(1):
-                        object_name = match.group(1)
-                        object_type = match.group(2) or "UNKNOWN"
-                        
-                        if len(object_name) > 2:  # Filter out short lines
-                            invalid_objects.append({
-                                "object": object_name,
-                                "type": object_type.strip(),
-                                "source": "invalid_log"
-                            })
+            for line in self._iter_lines(self.invalid_log_path):
+                in_invalid_section = self._track_invalid_section(
+                    line, line.lower(), in_invalid_section, invalid_objects
+                )
 
             logger.info(f"Extracted {len(invalid_objects)} invalid objects")
             self.invalid_objects = invalid_objects
@@ -155,39 +438,61 @@ class DeploymentValidator:
             return []
 
     def validate_invalid_delta(self) -> bool:
+        """
+        Compare the invalid counts at start and end of the deployment; the first
+        occurrence of each count line is used. Invalid objects listed in the log
+        are collected and published only when the check fails.
+        """
         try:
             logger.info("Starting invalid delta validation")
             start_count: Optional[int] = None
             end_count: Optional[int] = None
+            invalid_objects: List[Dict] = []
+            in_invalid_section = False
 
-            with open(self.invalid_log_path, "r", errors="ignore") as f:
-                lines = f.readlines()
-
+            lines = self._iter_lines(self.invalid_log_path)
             for line in lines:
                 line_lower = line.lower()
 
-                if "number of invalids at start" in line_lower:
-                    numbers = re.findall(r"\d+", line)
-                    if numbers:
-                        start_count = int(numbers[0])
+                if start_count is None and b"number of invalids at start" in line_lower:
+                    number = DIGITS_PATTERN.search(line)
+                    if number:
+                        start_count = int(number.group(0))
+
+                elif end_count is None and b"number of invalids at end" in line_lower:
+                    number = DIGITS_PATTERN.search(line)
+                    if number:
+                        end_count = int(number.group(0))
+
+                in_invalid_section = self._track_invalid_section(
+                    line, line_lower, in_invalid_section, invalid_objects
+                )
 
-                elif "number of invalids at end" in line_lower:
-                    numbers = re.findall(r"\d+", line)
-                    if numbers:
-                        end_count = int(numbers[0])
+                # Both counts known - only the object listing can still be needed
+                if start_count is not None and end_count is not None:
+                    break
+
+            if start_count is not None and start_count == end_count:
+                logger.info(f"Invalid delta validation passed: {start_count} == {end_count}")
+                return True
+
+            # Failing: collect the rest of the object listing from where the
+            # count scan stopped, without reading the log a second time
+            for line in lines:
+                in_invalid_section = self._track_invalid_section(
+                    line, line.lower(), in_invalid_section, invalid_objects
+                )
 
             if start_count is None or end_count is None:
                 logger.warning("Could not extract start/end invalid counts from log")
+                self._publish_invalid_objects(invalid_objects)
                 self.invalid_mismatch = True
                 return False
 
-            if start_count != end_count:
-                logger.warning(f"Invalid delta detected: start={start_count}, end={end_count}")
-                self.invalid_mismatch = True
-                return False
-
-            logger.info(f"Invalid delta validation passed: {start_count} == {end_count}")
-            return True
+            logger.warning(f"Invalid delta detected: start={start_count}, end={end_count}")
+            self._publish_invalid_objects(invalid_objects)
+            self.invalid_mismatch = True
+            return False
         
         except FileNotFoundError as e:
             logger.error(f"Invalid log file not found: {e}")
@@ -202,6 +507,10 @@ class DeploymentValidator:
             self.invalid_mismatch = False
             return False
 
+    def _publish_invalid_objects(self, invalid_objects: List[Dict]) -> None:
+        logger.info(f"Extracted {len(invalid_objects)} invalid objects")
+        self.invalid_objects = invalid_objects
+
     # ==========================================================
     # 3️⃣ EXECUTION INTEGRITY VALIDATION
     # ==========================================================
@@ -209,39 +518,25 @@ class DeploymentValidator:
     def validate_execution_integrity(self) -> bool:
         try:
             logger.info("Starting execution integrity validation")
-            execution_start: List[str] = []
-            execution_end: List[str] = []
-
-            with open(self.main_log_path, "r", errors="ignore") as f:
-                for line in f:
-                    line_lower = line.lower()
-
-                    if "execution start" in line_lower:
-                        unit = self._extract_unit_from_line(line)
-                        if unit:
-                            execution_start.append(unit)
-
-                    elif "execution end" in line_lower:
-                        unit = self._extract_unit_from_line(line)
-                        if unit:
-                            execution_end.append(unit)
-
-            start_set = set(execution_start)
-            end_set = set(execution_end)
-
-            if len(execution_start) != len(execution_end):
-                logger.warning(f"Execution count mismatch: {len(execution_start)} starts vs {len(execution_end)} ends")
+            self._scan_main_log()
+            execution_start = self._execution_start
+            execution_end = self._execution_end
+
+            start_total = sum(execution_start.values())
+            end_total = sum(execution_end.values())
+
+            if execution_start != execution_end:
+                # Multiset differences also catch a unit started twice but ended once
+                missing_ends = execution_start - execution_end
+                missing_starts = execution_end - execution_start
+                logger.warning(
+                    f"Execution mismatch: {start_total} starts vs {end_total} ends - "
+                    f"Missing ends: {dict(missing_ends)}, Missing starts: {dict(missing_starts)}"
+                )
                 self.execution_mismatch = True
                 return False
 
-            if start_set != end_set:
-                missing_ends = start_set - end_set
-                missing_starts = end_set - start_set
-                logger.warning(f"Execution set mismatch - Missing ends: {missing_ends}, Missing starts: {missing_starts}")
-                self.execution_mismatch = True
-                return False
-
-            logger.info(f"Execution integrity validation passed: {len(execution_start)} units tracked successfully")
+            logger.info(f"Execution integrity validation passed: {start_total} units tracked successfully")
             self.execution_mismatch = False
             return True
         
@@ -255,15 +550,17 @@ class DeploymentValidator:
             return False
 
     @staticmethod
-    def _extract_unit_from_line(line: str) -> Optional[str]:
-        marker = " - execution"
-        marker_index = line.lower().find(marker)
+    def _extract_unit_from_line(line: bytes) -> Optional[str]:
+        """Extract unit name from a "<path> - execution ..." line."""
+        # Case-insensitive search in place - no lowercased copy of the line
+        marker = UNIT_MARKER_PATTERN.search(line)
 
-        if marker_index == -1:
+        if marker is None:
             return None
 
+        marker_index = marker.start()
         path_part = line[:marker_index].strip()
-        unit = Path(path_part).name
+        unit = _basename(path_part)
 
         return unit if unit else None
 
@@ -275,14 +572,18 @@ class DeploymentValidator:
         try:
             logger.info("Starting comprehensive deployment validation")
             
-            error_valid = self.validate_errors()
-            invalid_valid = self.validate_invalid_delta()
-            execution_valid = self.validate_execution_integrity()
-            
-            # Extract invalid objects if validation failed on invalid delta
-            if not invalid_valid:
-                logger.info("Invalid delta detected, extracting invalid objects")
-                self.invalid_objects = self.extract_invalid_objects()
+            # The checks write disjoint attributes, so run them concurrently. The error
+            # and execution checks share one main_log pass; whichever gets there first
+            # scans it under _main_log_lock and the other reuses the result.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                error_future = executor.submit(self.validate_errors)
+                invalid_future = executor.submit(self.validate_invalid_delta)
+                execution_future = executor.submit(self.validate_execution_integrity)
+
+            error_valid = error_future.result()
+            invalid_valid = invalid_future.result()
+            execution_valid = execution_future.result()
+            # invalid_objects was filled by the invalid delta pass if it failed
 
             if not error_valid:
                 logger.warning("Validation FAILED: Non-ignorable errors detected")
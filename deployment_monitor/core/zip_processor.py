@@ -1,45 +1,125 @@
+import atexit
+import ntpath
+import posixpath
 import zipfile
 import tempfile
 import shutil
 import logging
+import queue
+import threading
+import uuid
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger("deployment_monitor.zip_processor")
 
+MAIN_LOG_SUFFIX = "_oracle.log_completed.log"
+INVALID_LOG_SUFFIX = "_invalids_completed.log"
+ERROR_LOG_MARKER = "oracle_error"
+
+# One extraction root per process; each ZIP gets its own subdirectory under it
+_extraction_root: Optional[Path] = None
+_extraction_root_lock = threading.Lock()
+
+
+def _get_extraction_root() -> Path:
+    global _extraction_root
+    with _extraction_root_lock:
+        if _extraction_root is None:
+            _extraction_root = Path(tempfile.mkdtemp(prefix="depmon_"))
+        return _extraction_root
+
+
+def remove_extraction_root():
+    """
+    Synchronously delete this process's extraction root and everything
+    under it. Runs at interpreter exit; pool workers leave via os._exit,
+    skipping atexit and killing daemon threads, so they call it directly.
+    """
+    global _extraction_root
+    with _extraction_root_lock:
+        root, _extraction_root = _extraction_root, None
+    if root is not None:
+        shutil.rmtree(root, ignore_errors=True)
+        logger.debug(f"Extraction root removed: {root}")
+
+
+atexit.register(remove_extraction_root)
+
+
+# Extracted folders are removed by a background thread so the caller can
+# move on to the next ZIP instead of waiting on a recursive delete
+_cleanup_queue: "queue.Queue[Path]" = queue.Queue()
+_cleanup_thread: Optional[threading.Thread] = None
+_cleanup_thread_lock = threading.Lock()
+
+
+def _cleanup_worker():
+    while True:
+        path = _cleanup_queue.get()
+        try:
+            shutil.rmtree(path, ignore_errors=True)
+            logger.debug(f"Temporary directory cleanup complete: {path}")
+        finally:
+            _cleanup_queue.task_done()
+
+
+def _schedule_removal(path: Path):
+    global _cleanup_thread
+    with _cleanup_thread_lock:
+        if _cleanup_thread is None:
+            _cleanup_thread = threading.Thread(target=_cleanup_worker, name="zip-cleanup", daemon=True)
+            _cleanup_thread.start()
+    _cleanup_queue.put(path)
+
 
 class ZipProcessor:
     @staticmethod
-    def _validate_extract_path(extract_dir: Path, member_path: str) -> Path:
+    def _validate_extract_path(member_path: str) -> str:
         """
-        Validate that extracted file stays within extraction directory.
+        Validate that an archive member stays within the extraction directory.
         Prevents directory traversal attacks (e.g., ../../etc/passwd).
+        Pure string check on the member name, so no filesystem lookups per member.
         
         Args:
-            extract_dir: The directory files are being extracted to
             member_path: The path of the file being extracted
             
         Returns:
-            Validated absolute path
+            Validated member path
             
         Raises:
             ValueError: If path traversal detected
         """
-        member_abs = (extract_dir / member_path).resolve()
-        extract_abs = extract_dir.resolve()
-        
-        try:
-            member_abs.relative_to(extract_abs)
-            return member_abs
-        except ValueError:
+        normalized = posixpath.normpath(member_path.replace("\\", "/"))
+
+        if (
+            normalized.startswith("/")
+            or normalized == ".."
+            or normalized.startswith("../")
+            or ntpath.splitdrive(member_path)[0]
+        ):
             logger.error(f"Path traversal detected: {member_path}")
             raise ValueError(f"Malicious path detected in ZIP: {member_path}")
+
+        return member_path
     
     def __init__(self, zip_path: str | Path, config: dict):
         self.zip_path: Path = Path(zip_path)
         self.config = config
         self.temp_dir: Optional[Path] = None
 
+        # Required logs, recorded while the ZIP is extracted
+        self._main_log: Optional[Path] = None
+        self._invalid_log: Optional[Path] = None
+        self._error_log: Optional[Path] = None
+
+        # instance -> cluster, so cluster detection is a single lookup.
+        # setdefault keeps the first cluster listing an instance, as the old linear scan did
+        self._instance_to_cluster: Dict[str, str] = {}
+        for cluster, instances in config.get("clusters", {}).items():
+            for instance in instances:
+                self._instance_to_cluster.setdefault(instance, cluster)
+
     # ==========================================================
     # ZIP EXTRACTION
     # ==========================================================
@@ -64,17 +144,21 @@ class ZipProcessor:
             if not zipfile.is_zipfile(self.zip_path):
                 raise ValueError(f"Invalid ZIP file: {self.zip_path}")
 
-            temp_dir = Path(tempfile.mkdtemp())
+            temp_dir = _get_extraction_root() / uuid.uuid4().hex
+            temp_dir.mkdir()
             self.temp_dir = temp_dir
             logger.debug(f"Created temporary directory: {temp_dir}")
 
             with zipfile.ZipFile(self.zip_path, "r") as zip_ref:
-                for member in zip_ref.namelist():
-                    # Validate member path
-                    self._validate_extract_path(temp_dir, member)
-                    zip_ref.extract(member, temp_dir)
+                # Validate every member path before anything is written
+                members = [self._validate_extract_path(member) for member in zip_ref.namelist()]
+                zip_ref.extractall(temp_dir, members=members)
+
+            for member in members:
+                if not member.endswith("/"):
+                    self._record_log_file(temp_dir / member)
             
-            logger.info(f"ZIP extraction successful: {len(list(temp_dir.rglob('*')))} files extracted")
+            logger.info(f"ZIP extraction successful: {len(members)} files extracted")
             return temp_dir
         
         except FileNotFoundError as e:
@@ -94,6 +178,22 @@ class ZipProcessor:
     # LOG DISCOVERY
     # ==========================================================
 
+    def _record_log_file(self, file_path: Path):
+        """Remember file_path if it is one of the logs validation needs."""
+        file_lower = file_path.name.lower()
+
+        if file_lower.endswith(MAIN_LOG_SUFFIX):
+            self._main_log = file_path
+            logger.debug(f"Found main log: {file_path.name}")
+
+        elif file_lower.endswith(INVALID_LOG_SUFFIX):
+            self._invalid_log = file_path
+            logger.debug(f"Found invalid log: {file_path.name}")
+
+        elif ERROR_LOG_MARKER in file_lower:
+            self._error_log = file_path
+            logger.debug(f"Found error log: {file_path.name}")
+
     def _find_required_logs(self) -> Tuple[Optional[Path], Optional[Path], Optional[Path]]:
         """
         Identify:
@@ -113,27 +213,10 @@ class ZipProcessor:
             if self.temp_dir is None:
                 raise RuntimeError("ZIP must be extracted before searching logs.")
 
-            main_log: Optional[Path] = None
-            invalid_log: Optional[Path] = None
-            error_log: Optional[Path] = None
-
-            for file_path in self.temp_dir.rglob("*"):
-                if not file_path.is_file():
-                    continue
-
-                file_lower = file_path.name.lower()
-
-                if file_lower.endswith("_oracle.log_completed.log"):
-                    main_log = file_path
-                    logger.debug(f"Found main log: {file_path.name}")
-
-                elif file_lower.endswith("_invalids_completed.log"):
-                    invalid_log = file_path
-                    logger.debug(f"Found invalid log: {file_path.name}")
-
-                elif "oracle_error" in file_lower:
-                    error_log = file_path
-                    logger.debug(f"Found error log: {file_path.name}")
+            # Logs were identified during extraction - no second walk of the tree
+            main_log = self._main_log
+            invalid_log = self._invalid_log
+            error_log = self._error_log
 
             logger.info(f"Log discovery complete - main: {main_log is not None}, invalid: {invalid_log is not None}, error: {error_log is not None}")
             return main_log, invalid_log, error_log
@@ -175,12 +258,12 @@ class ZipProcessor:
         try:
             logger.debug(f"Detecting cluster for instance: {instance}")
             
-            for cluster, instances in self.config["clusters"].items():
-                if instance in instances:
-                    logger.info(f"Instance {instance} mapped to cluster: {cluster}")
-                    return cluster
+            cluster = self._instance_to_cluster.get(instance)
+            if cluster is None:
+                raise ValueError(f"Instance '{instance}' not mapped to any cluster in config.")
 
-            raise ValueError(f"Instance '{instance}' not mapped to any cluster in config.")
+            logger.info(f"Instance {instance} mapped to cluster: {cluster}")
+            return cluster
         
         except ValueError as e:
             logger.error(f"Cluster detection failed: {e}")
@@ -269,12 +352,13 @@ class ZipProcessor:
     def cleanup(self):
         """
         Remove temporary extraction directory.
+        The delete itself runs on a background thread.
         """
         try:
             if self.temp_dir and self.temp_dir.exists():
                 logger.info(f"Cleaning up temporary directory: {self.temp_dir}")
-                shutil.rmtree(self.temp_dir)
-                logger.debug("Temporary directory cleanup complete")
+                _schedule_removal(self.temp_dir)
+                self.temp_dir = None
             else:
                 logger.debug("No temporary directory to clean up")
         except Exception as e:
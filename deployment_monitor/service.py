@@ -1,10 +1,13 @@
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 import json
 
 from core.folder_monitor import FolderMonitor
 from core.msg_processor import MsgProcessor
-from core.zip_processor import ZipProcessor
+from core.zip_processor import ZipProcessor, remove_extraction_root
 from core.validator import DeploymentValidator
 from core.jira_extractor import JiraExtractor
 from core.archiver import Archiver
@@ -34,6 +37,33 @@ def load_config():
         return json.load(f)
 
 
+# ==========================================================
+# ZIP WORKER
+# ==========================================================
+
+def _process_zip(zip_path, config):
+    """
+    Extract, validate and pull Jira units from one deployment ZIP.
+    Runs in a worker process; archiving and notification stay in main().
+    The extracted files are deleted before returning: a worker exits via
+    os._exit, so ZipProcessor.cleanup()'s background delete and the atexit
+    hook would never run there.
+    """
+    zip_processor = ZipProcessor(zip_path, config)
+    try:
+        metadata = zip_processor.process()
+
+        validator = DeploymentValidator(metadata, config)
+        validation_result = validator.validate_all()
+
+        jira_extractor = JiraExtractor(metadata["main_log_path"])
+        jira_units = jira_extractor.extract()
+    finally:
+        remove_extraction_root()
+
+    return metadata, validation_result, jira_units
+
+
 # ==========================================================
 # MAIN SERVICE
 # ==========================================================
@@ -62,80 +92,75 @@ def main():
     notifier = Notifier()
 
     monitor = FolderMonitor(INCOMING_PATH, poll_interval=poll_interval)
-
-    for file in monitor.start_polling():
-
-        print(f"\nDetected file: {file.name}")
-
-        try:
-            zip_files_to_process = []
-
-            # --------------------------------------------------
-            # If MSG file → extract ZIP
-            # --------------------------------------------------
-            if file.suffix.lower() == ".msg":
-                print("Extracting ZIP from MSG...")
-                msg_processor = MsgProcessor(file, INCOMING_PATH)
-                extracted_zips = msg_processor.extract_zip_attachments()
-
-                if not extracted_zips:
-                    print("No ZIP attachment found inside MSG.")
-                else:
-                    zip_files_to_process.extend(extracted_zips)
-
-                # Move MSG to processed folder
-                shutil.move(str(file), PROCESSED_MSG_FOLDER / file.name)
-
-            # --------------------------------------------------
-            # If ZIP file → process directly
-            # --------------------------------------------------
-            elif file.suffix.lower() == ".zip":
-                zip_files_to_process.append(file)
-
-            # --------------------------------------------------
-            # Process ZIP files
-            # --------------------------------------------------
-            for zip_path in zip_files_to_process:
-
-                print(f"Processing ZIP: {zip_path.name}")
-
-                zip_processor = ZipProcessor(zip_path, config)
-                metadata = zip_processor.process()
-
-                validator = DeploymentValidator(metadata, config)
-                validation_result = validator.validate_all()
-
-                status = validation_result["status"]
-                message = validation_result["message"]
-
-                jira_extractor = JiraExtractor(metadata["main_log_path"])
-                jira_units = jira_extractor.extract()
-
-                final_folder = archiver.archive(
-                    status=status,
-                    cluster=metadata["cluster"],
-                    instance=metadata["instance"],
-                    original_zip_path=zip_path,
-                    jira_units=jira_units
-                )
-
-                print(f"Validation Status: {status}")
-                print(f"Archived To: {final_folder}")
-
-                notifier.notify(
-                    f"Cluster: {metadata['cluster'].upper()}\n"
-                    f"Instance: {metadata['instance']}\n"
-                    f"Status: {status}\n\n"
-                    f"{message}\n\n"
-                    f"Please review and release flag if PASS."
-                )
-
-                zip_processor.cleanup()
-
-            monitor.mark_as_processed(file)
-
-        except Exception as e:
-            print(f"ERROR while processing {file.name}: {e}")
+    # The with block shuts the pool down on any exit, including Ctrl+C
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+
+        for file in monitor.start_polling():
+
+            print(f"\nDetected file: {file.name}")
+
+            try:
+                zip_files_to_process = []
+
+                # --------------------------------------------------
+                # If MSG file → extract ZIP
+                # --------------------------------------------------
+                if file.suffix.lower() == ".msg":
+                    print("Extracting ZIP from MSG...")
+                    msg_processor = MsgProcessor(file, INCOMING_PATH)
+                    extracted_zips = msg_processor.extract_zip_attachments()
+
+                    if not extracted_zips:
+                        print("No ZIP attachment found inside MSG.")
+                    else:
+                        zip_files_to_process.extend(extracted_zips)
+
+                    # Move MSG to processed folder
+                    shutil.move(str(file), PROCESSED_MSG_FOLDER / file.name)
+
+                # --------------------------------------------------
+                # If ZIP file → process directly
+                # --------------------------------------------------
+                elif file.suffix.lower() == ".zip":
+                    zip_files_to_process.append(file)
+
+                # --------------------------------------------------
+                # Process ZIP files
+                # --------------------------------------------------
+                # Extraction and log scanning are independent per ZIP, so they
+                # run in worker processes; results come back in submission order
+                results = executor.map(_process_zip, zip_files_to_process, repeat(config))
+
+                for zip_path, (metadata, validation_result, jira_units) in zip(zip_files_to_process, results):
+
+                    print(f"Processing ZIP: {zip_path.name}")
+
+                    status = validation_result["status"]
+                    message = validation_result["message"]
+
+                    final_folder = archiver.archive(
+                        status=status,
+                        cluster=metadata["cluster"],
+                        instance=metadata["instance"],
+                        original_zip_path=zip_path,
+                        jira_units=jira_units
+                    )
+
+                    print(f"Validation Status: {status}")
+                    print(f"Archived To: {final_folder}")
+
+                    notifier.notify(
+                        f"Cluster: {metadata['cluster'].upper()}\n"
+                        f"Instance: {metadata['instance']}\n"
+                        f"Status: {status}\n\n"
+                        f"{message}\n\n"
+                        f"Please review and release flag if PASS."
+                    )
+
+                monitor.mark_as_processed(file)
+
+            except Exception as e:
+                print(f"ERROR while processing {file.name}: {e}")
 
     print("Service stopped.")
 
@@ -16,7 +16,6 @@ This guarantees that the background thread and the UI main thread always
 reference the exact same queue/buffer/event objects.
 """
 
-import queue
 import threading
 import time
 from collections import deque
@@ -28,68 +27,96 @@ from collections import deque
 # in sys.modules after the first import.
 # ==========================================================
 
-# Thread-safe queue for log messages (background → main thread)
-log_queue = queue.Queue()
+# Maximum number of log lines kept in memory
+MAX_LOGS = 500
 
-# Thread-safe queue for session state updates (background → main thread)
-state_queue = queue.Queue()
+# Log messages (background → main thread). deque append/popleft are atomic
+# under the GIL, so producers never take a lock; bounded like log_buffer
+log_queue = deque(maxlen=MAX_LOGS)
+
+# Messages evicted from a full log_queue since the last drain; reported as
+# one summary line instead of raising in the producer
+dropped_logs = 0
+
+# Pending session state updates (background → main thread), one slot per key.
+# Values are latest-wins, so a dict replaces a queue of (key, value) tuples;
+# single dict setitem/popitem calls are atomic under the GIL
+pending_state = {}
 
 # In-memory circular buffer — the authoritative log store
 # The main thread copies this into st.session_state on each rerun
-log_buffer = deque(maxlen=500)
-
-# Lock for thread-safe access to log_buffer
-buffer_lock = threading.Lock()
+log_buffer = deque(maxlen=MAX_LOGS)
 
 # Event to signal background thread to stop
 stop_event = threading.Event()
 
+# (epoch second, "[HH:MM:SS] " prefix) of the last log timestamp
+_timestamp_cache = (0, "")
+
 
 # ==========================================================
 # Thread-safe helper functions
 # ==========================================================
 
+def _log_prefix() -> str:
+    """Log line prefix "[HH:MM:SS] " for now, formatted at most once per second."""
+    global _timestamp_cache
+    now = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != now:
+        # Swapped as one tuple; racing threads at worst format the same second twice
+        cached = (now, time.strftime("[%H:%M:%S] ", time.localtime(now)))
+        _timestamp_cache = cached
+    return cached[1]
+
+
 def add_log(message: str):
     """Add a log message. Safe to call from ANY thread."""
-    timestamp = time.strftime("%H:%M:%S")
-    formatted_msg = f"[{timestamp}] {message}"
-    log_queue.put(formatted_msg)
-    with buffer_lock:
-        log_buffer.append(formatted_msg)
+    global dropped_logs
+    # One concatenation; the bracketed prefix is shared by every message in the second
+    formatted_msg = _log_prefix() + message
+    if len(log_queue) == MAX_LOGS:
+        # Full: this append evicts the oldest entry. The += is not atomic, so
+        # racing producers may undercount; it is a diagnostic, not a ledger
+        dropped_logs += 1
+    log_queue.append(formatted_msg)
+    # Reader-visible side last; deque append is atomic, so no lock is needed
+    log_buffer.append(formatted_msg)
 
 
 def set_status(status: str):
     """Queue a status update. Safe to call from ANY thread."""
-    state_queue.put(("last_status", status))
+    pending_state["last_status"] = status
 
 
 def get_all_logs() -> list:
     """Get a snapshot of all logs from the buffer. Thread-safe."""
-    with buffer_lock:
-        return list(log_buffer)
+    return list(log_buffer)
 
 
 def drain_queue():
-    """Drain the log queue (prevents unbounded growth). Call from main thread."""
-    while not log_queue.empty():
-        try:
-            log_queue.get_nowait()
-        except queue.Empty:
-            break
+    """
+    Drain the log queue (prevents unbounded growth). Call from main thread.
+    If messages were dropped since the last drain, one summary line is logged.
+    """
+    global dropped_logs
+    # Messages are discarded, so one atomic clear replaces a popleft per item
+    log_queue.clear()
+
+    dropped, dropped_logs = dropped_logs, 0
+    if dropped:
+        log_buffer.append(_log_prefix() + f"⚠️ {dropped} log messages dropped (log queue full)")
 
 
 def drain_state_queue() -> list:
-    """Drain state queue and return all updates. Call from main thread."""
-    updates = []
-    while not state_queue.empty():
-        try:
-            updates.append(state_queue.get_nowait())
-        except queue.Empty:
-            break
-    return updates
+    """Drain pending state updates and return them as (key, value) pairs. Call from main thread."""
+    # Only this function removes keys, so the current size bounds the loop and
+    # popitem never hits an empty dict. A key set mid-drain waits for the next drain
+    return [pending_state.popitem() for _ in range(len(pending_state))]
 
 
 def has_pending_logs(session_log_count: int) -> bool:
     """Check if there are logs in the buffer that aren't in session yet."""
-    with buffer_lock:
-        return len(log_buffer) > session_log_count
+    # Lock-free: len() of a deque is one atomic read. A stale value only
+    # means the UI picks the new lines up on its next poll
+    return len(log_buffer) > session_log_count
@@ -15,22 +15,17 @@ log_queue = queue.Queue()
 session_state = FakeSessionState()
 
 def add_log(message: str):
-    """Simulate add_log function"""
-    timestamp = time.strftime("%H:%M:%S")
-    formatted_msg = f"[{timestamp}] {message}"
+    """Simulate add_log function (prefix + message, as shared_state.add_log builds it)"""
+    formatted_msg = time.strftime("[%H:%M:%S] ") + message
     log_queue.put(formatted_msg)
     print(f"✈️  Queued: {message} (queue_size={log_queue.qsize()})")
 
 def flush_log_queue():
     """Simulate flush_log_queue function"""
-    count = 0
-    while not log_queue.empty():
-        try:
-            msg = log_queue.get_nowait()
-            session_state.logs.append(msg)
-            count += 1
-        except queue.Empty:
-            break
+    # One size read bounds the drain; this is the only consumer, so it can't run dry
+    count = log_queue.qsize()
+    for _ in range(count):
+        session_state.logs.append(log_queue.get_nowait())
     if count > 0:
         print(f"✅ Flushed {count} messages. Total logs: {len(session_state.logs)}")
 
@@ -45,30 +40,31 @@ def background_worker():
     add_log("Background thread finished")
 
 # Test
-print("=" * 50)
-print("Testing queue mechanism")
-print("=" * 50)
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Testing queue mechanism")
+    print("=" * 50)
 
-# Main thread calls add_log
-add_log("Main thread message 1")
+    # Main thread calls add_log
+    add_log("Main thread message 1")
 
-# Start background thread
-print("\n🔄 Starting background thread...")
-thread = threading.Thread(target=background_worker, daemon=True)
-thread.start()
+    # Start background thread
+    print("\n🔄 Starting background thread...")
+    thread = threading.Thread(target=background_worker, daemon=True)
+    thread.start()
 
-# Give thread time to queue messages
-time.sleep(0.5)
+    # Wait for the thread to queue all of its messages
+    thread.join()
 
-# Main thread flushes
-print("\n🔄 Flushing queue...")
-flush_log_queue()
+    # Main thread flushes
+    print("\n🔄 Flushing queue...")
+    flush_log_queue()
 
-# Display logs
-print("\n📜 Final logs in session_state:")
-for i, log in enumerate(session_state.logs, 1):
-    print(f"  {i}. {log}")
+    # Display logs
+    print("\n📜 Final logs in session_state:")
+    for i, log in enumerate(session_state.logs, 1):
+        print(f"  {i}. {log}")
 
-print("\n" + "=" * 50)
-print(f"✓ Success: {len(session_state.logs)} messages processed")
-print("=" * 50)
+    print("\n" + "=" * 50)
+    print(f"✓ Success: {len(session_state.logs)} messages processed")
+    print("=" * 50)
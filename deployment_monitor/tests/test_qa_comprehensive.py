@@ -11,9 +11,12 @@ Test Categories:
 """
 
 import unittest
+import io
 import json
+import os
 import tempfile
 import shutil
+import uuid
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import sys
@@ -21,36 +24,45 @@ import sys
 # Add core modules to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core import email_sender
 from core.email_sender import EmailSender
+from core import validator as validator_module
 from core.validator import DeploymentValidator
 from core.cycle_manager import CycleManager
+import shared_state
+from core import folder_monitor
+from core.folder_monitor import FolderMonitor
 
 
 class TestEmailSender(unittest.TestCase):
     """POSITIVE & NEGATIVE TESTS: Email Sender Module"""
     
-    def setUp(self):
-        """Setup test fixtures"""
-        self.config_enabled = {
-            "email_settings": {
-                "enabled": True,
-                "recipients": ["test@company.com", "qa@company.com"],
-                "subject_templates": {
-                    "PASS": "[PASS] {cluster} - {instance}",
-                    "FAIL": "[FAIL] {cluster} - {instance}"
-                },
-                "body_template": "Status: {status}\nMessage: {message}"
-            }
+    config_enabled = {
+        "email_settings": {
+            "enabled": True,
+            "recipients": ["test@company.com", "qa@company.com"],
+            "subject_templates": {
+                "PASS": "[PASS] {cluster} - {instance}",
+                "FAIL": "[FAIL] {cluster} - {instance}"
+            },
+            "body_template": "Status: {status}\nMessage: {message}"
         }
-        
-        self.config_disabled = {
-            "email_settings": {
-                "enabled": False,
-                "recipients": ["test@company.com"]
-            }
+    }
+    
+    config_disabled = {
+        "email_settings": {
+            "enabled": False,
+            "recipients": ["test@company.com"]
         }
-        
-        self.config_empty = {}
+    }
+    
+    config_empty = {}
+
+    @classmethod
+    def setUpClass(cls):
+        """Shared senders for tests that don't exercise the constructor"""
+        cls.sender_enabled = EmailSender(cls.config_enabled)
+        cls.sender_disabled = EmailSender(cls.config_disabled)
     
     # ============ POSITIVE TESTS ============
     
@@ -69,26 +81,26 @@ class TestEmailSender(unittest.TestCase):
     
     def test_build_subject_pass_status(self):
         """✅ TEST: Build PASS subject correctly"""
-        sender = EmailSender(self.config_enabled)
+        sender = self.sender_enabled
         subject = sender.build_subject("PASS", "MENA", "FSMHO1U")
         self.assertEqual(subject, "[PASS] MENA - FSMHO1U")
     
     def test_build_subject_fail_status(self):
         """✅ TEST: Build FAIL subject correctly"""
-        sender = EmailSender(self.config_enabled)
+        sender = self.sender_enabled
         subject = sender.build_subject("FAIL", "SSA", "FCCNIG")
         self.assertEqual(subject, "[FAIL] SSA - FCCNIG")
     
     def test_build_body_with_all_placeholders(self):
         """✅ TEST: Build body with all placeholders replaced"""
-        sender = EmailSender(self.config_enabled)
+        sender = self.sender_enabled
         body = sender.build_body("PASS", "CEE", "FMSLO1P", "All checks passed")
         self.assertIn("PASS", body)
         self.assertIn("All checks passed", body)
     
     def test_send_mail_disabled(self):
         """✅ TEST: send_mail returns graceful error when disabled"""
-        sender = EmailSender(self.config_disabled)
+        sender = self.sender_disabled
         success, msg = sender.send_mail("Test", "Test Body")
         self.assertFalse(success)
         self.assertIn("disabled", msg.lower())
@@ -124,31 +136,41 @@ class TestEmailSender(unittest.TestCase):
     
     def test_build_subject_with_special_characters(self):
         """❌ TEST: Handle special characters in cluster/instance names"""
-        sender = EmailSender(self.config_enabled)
+        sender = self.sender_enabled
         subject = sender.build_subject("PASS", "MENA@#$", "FSMHO1U-TEST")
         self.assertIsNotNone(subject)
     
     def test_send_deployment_summary_pass(self):
         """✅ TEST: send_deployment_summary called with PASS status"""
-        sender = EmailSender(self.config_disabled)
+        sender = self.sender_disabled
         success, msg = sender.send_deployment_summary("PASS", "MENA", "FSMHO1U", "Validation successful")
         self.assertFalse(success)  # Disabled, so should fail gracefully
     
-    @patch('core.email_sender.win32com.client.Dispatch')
-    def test_send_mail_outlook_exception_handled(self, mock_dispatch):
+    @unittest.skipUnless(sys.platform == "win32", "Outlook only on Windows")
+    def test_send_mail_outlook_exception_handled(self):
         """❌ TEST: Handle Outlook COM exceptions gracefully"""
         mock_outlook = MagicMock()
         mock_outlook.CreateItem.side_effect = Exception("Outlook not available")
-        mock_dispatch.return_value = mock_outlook
-        
-        sender = EmailSender(self.config_enabled)
-        success, msg = sender.send_mail("Test", "Test Body")
+
+        sender = self.sender_enabled
+        with patch.object(email_sender.win32com.client, "Dispatch", return_value=mock_outlook):
+            success, msg = sender.send_mail("Test", "Test Body")
         self.assertFalse(success)
         self.assertIn("failed", msg.lower())
 
 
 class TestDeploymentValidator(unittest.TestCase):
     """POSITIVE & NEGATIVE TESTS: Validator Module"""
+
+    @classmethod
+    def setUpClass(cls):
+        """One temp root per class; each test gets its own subdirectory"""
+        cls._root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Cleanup temp files"""
+        shutil.rmtree(cls._root, ignore_errors=True)
     
     def setUp(self):
         """Setup test fixtures"""
@@ -157,7 +179,8 @@ class TestDeploymentValidator(unittest.TestCase):
         }
         
         # Create temporary log files
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = os.path.join(self._root, uuid.uuid4().hex)
+        os.makedirs(self.temp_dir)
         self.main_log = Path(self.temp_dir) / "main.log"
         self.invalid_log = Path(self.temp_dir) / "invalids.log"
         self.error_log = Path(self.temp_dir) / "error.log"
@@ -167,10 +190,14 @@ class TestDeploymentValidator(unittest.TestCase):
             "invalid_log_path": self.invalid_log,
             "error_log_path": self.error_log
         }
-    
-    def tearDown(self):
-        """Cleanup temp files"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _stream_metadata(self, main_log: str, invalid_log: str, error_log: str = None) -> dict:
+        """In-memory log fixtures; the validator reads file-like objects directly"""
+        return {
+            "main_log_path": io.StringIO(main_log),
+            "invalid_log_path": io.StringIO(invalid_log),
+            "error_log_path": io.StringIO(error_log) if error_log is not None else None
+        }
     
     # ============ POSITIVE TESTS ============
     
@@ -181,50 +208,44 @@ class TestDeploymentValidator(unittest.TestCase):
         self.assertFalse(validator.execution_mismatch)
         self.assertEqual(len(validator.detected_errors), 0)
     
-    def test_validate_errors_no_errors(self):
-        """✅ TEST: Validation passes when no errors detected"""
-        # Create clean log
-        self.main_log.write_text("Compilation successful\nNo errors found")
-        self.invalid_log.write_text("Number of invalids at start: 0\nNumber of invalids at end: 0")
-        self.error_log.write_text("")
-        
-        validator = DeploymentValidator(self.metadata, self.config)
-        result = validator.validate_all()
-        
-        self.assertEqual(result["status"], "PASS")
-    
-    def test_validate_errors_ignorable_error(self):
-        """✅ TEST: Ignorable errors do not fail validation"""
-        # Log with ignorable error
-        self.main_log.write_text("ORA-00001: unique constraint violated\nBut this is ignorable")
-        self.invalid_log.write_text("Number of invalids at start: 0\nNumber of invalids at end: 0")
-        
-        validator = DeploymentValidator(self.metadata, self.config)
-        result = validator.validate_all()
-        
-        self.assertEqual(result["status"], "PASS")
-        self.assertIn("ORA-00001", validator.detected_errors)
-        self.assertNotIn("ORA-00001", validator.filtered_errors)
-    
-    def test_validate_errors_non_ignorable(self):
-        """✅ TEST: Non-ignorable errors fail validation"""
-        # Log with non-ignorable error
-        self.main_log.write_text("ORA-12514: listener connection refused")
-        self.invalid_log.write_text("Number of invalids at start: 0\nNumber of invalids at end: 0")
-        
-        validator = DeploymentValidator(self.metadata, self.config)
-        result = validator.validate_all()
-        
-        self.assertEqual(result["status"], "FAIL")
-        self.assertIn("ORA-12514", validator.filtered_errors)
+    # (case, main_log, error_log (None: missing error.log), expected status,
+    #  in detected_errors, not in filtered_errors, in filtered_errors)
+    VALIDATE_ALL_CASES = [
+        ("no errors", "Compilation successful\nNo errors found", "", "PASS", None, None, None),
+        ("ignorable error", "ORA-00001: unique constraint violated\nBut this is ignorable", None,
+         "PASS", "ORA-00001", "ORA-00001", None),
+        ("non-ignorable error", "ORA-12514: listener connection refused", None,
+         "FAIL", None, None, "ORA-12514"),
+    ]
+
+    def test_validate_all_status(self):
+        """✅ TEST: Clean logs and ignorable errors pass; non-ignorable errors fail validation"""
+        invalid_log = "Number of invalids at start: 0\nNumber of invalids at end: 0"
+
+        for case, main_log, error_log, status, detected, not_filtered, filtered in self.VALIDATE_ALL_CASES:
+            with self.subTest(case=case):
+                metadata = self._stream_metadata(main_log, invalid_log, error_log)
+                if error_log is None:
+                    # As in the original per-case tests: error.log path that was never written
+                    metadata["error_log_path"] = self.error_log
+
+                validator = DeploymentValidator(metadata, self.config)
+                result = validator.validate_all()
+
+                self.assertEqual(result["status"], status)
+                if detected:
+                    self.assertIn(detected, validator.detected_errors)
+                if not_filtered:
+                    self.assertNotIn(not_filtered, validator.filtered_errors)
+                if filtered:
+                    self.assertIn(filtered, validator.filtered_errors)
     
     def test_error_details_captured(self):
         """✅ TEST: Error details (unit, code, message) are captured"""
         log_content = "SCHEMA.PACKAGE_NAME - execution\nORA-00955: name is already used"
-        self.main_log.write_text(log_content)
-        self.invalid_log.write_text("Number of invalids at start: 0\nNumber of invalids at end: 0")
+        metadata = self._stream_metadata(log_content, "Number of invalids at start: 0\nNumber of invalids at end: 0")
         
-        validator = DeploymentValidator(self.metadata, self.config)
+        validator = DeploymentValidator(metadata, self.config)
         result = validator.validate_all()
         
         # Error should be detected
@@ -234,10 +255,9 @@ class TestDeploymentValidator(unittest.TestCase):
     
     def test_invalid_delta_validation_match(self):
         """✅ TEST: Valid invalid delta passes validation"""
-        self.main_log.write_text("Compilation successful")
-        self.invalid_log.write_text("Number of invalids at start: 5\nNumber of invalids at end: 5")
+        metadata = self._stream_metadata("Compilation successful", "Number of invalids at start: 5\nNumber of invalids at end: 5")
         
-        validator = DeploymentValidator(self.metadata, self.config)
+        validator = DeploymentValidator(metadata, self.config)
         result = validator.validate_invalid_delta()
         
         self.assertTrue(result)
@@ -245,14 +265,52 @@ class TestDeploymentValidator(unittest.TestCase):
     
     def test_invalid_delta_mismatch(self):
         """✅ TEST: Invalid delta mismatch is detected"""
-        self.main_log.write_text("Compilation successful")
-        self.invalid_log.write_text("Number of invalids at start: 5\nNumber of invalids at end: 8")
+        metadata = self._stream_metadata("Compilation successful", "Number of invalids at start: 5\nNumber of invalids at end: 8")
         
-        validator = DeploymentValidator(self.metadata, self.config)
+        validator = DeploymentValidator(metadata, self.config)
         result = validator.validate_invalid_delta()
         
         self.assertFalse(result)
         self.assertTrue(validator.invalid_mismatch)
+
+    def test_invalid_delta_mismatch_collects_objects(self):
+        """✅ TEST: Invalid objects are collected by the invalid delta pass"""
+        metadata = self._stream_metadata(
+            "Compilation successful",
+            "Number of invalids at start: 1\n"
+            "--- Invalid objects ---\n"
+            "SCHEMA.PKG_NEW (PACKAGE BODY)\n"
+            "---\n"
+            "Number of invalids at end: 2"
+        )
+
+        validator = DeploymentValidator(metadata, self.config)
+        result = validator.validate_invalid_delta()
+
+        self.assertFalse(result)
+        self.assertEqual(len(validator.invalid_objects), 1)
+        self.assertEqual(validator.invalid_objects[0]["object"], "SCHEMA.PKG_NEW")
+        self.assertEqual(validator.invalid_objects[0]["type"], "PACKAGE BODY")
+
+    def test_invalid_delta_first_count_occurrence_wins(self):
+        """❌ TEST: A later repeated count line does not turn a mismatch into a pass"""
+        self.main_log.write_text("Compilation successful")
+        self.invalid_log.write_text(
+            "Number of invalids at start: 1\n"
+            "Number of invalids at end: 2\n"
+            "Number of invalids at start: 2\n"
+            "--- Invalid objects ---\n"
+            "SCHEMA.PKG_LATE (PACKAGE)\n"
+            "---\n"
+        )
+
+        validator = DeploymentValidator(self.metadata, self.config)
+        result = validator.validate_invalid_delta()
+
+        self.assertFalse(result)
+        self.assertTrue(validator.invalid_mismatch)
+        # Objects listed after the count lines are still collected
+        self.assertEqual([o["object"] for o in validator.invalid_objects], ["SCHEMA.PKG_LATE"])
     
     def test_execution_integrity_valid(self):
         """✅ TEST: Valid execution start/end is detected"""
@@ -262,10 +320,9 @@ SCHEMA.PKG1 - execution end
 SCHEMA.PKG2 - execution start
 SCHEMA.PKG2 - execution end
         """
-        self.main_log.write_text(log_content)
-        self.invalid_log.write_text("Number of invalids at start: 0\nNumber of invalids at end: 0")
+        metadata = self._stream_metadata(log_content, "Number of invalids at start: 0\nNumber of invalids at end: 0")
         
-        validator = DeploymentValidator(self.metadata, self.config)
+        validator = DeploymentValidator(metadata, self.config)
         result = validator.validate_execution_integrity()
         
         self.assertTrue(result)
@@ -277,14 +334,29 @@ SCHEMA.PKG1 - execution start
 SCHEMA.PKG1 - execution start
 SCHEMA.PKG1 - execution end
         """
-        self.main_log.write_text(log_content)
-        self.invalid_log.write_text("Number of invalids at start: 0\nNumber of invalids at end: 0")
+        metadata = self._stream_metadata(log_content, "Number of invalids at start: 0\nNumber of invalids at end: 0")
         
-        validator = DeploymentValidator(self.metadata, self.config)
+        validator = DeploymentValidator(metadata, self.config)
         result = validator.validate_execution_integrity()
         
         self.assertFalse(result)
-    
+
+    def test_execution_integrity_same_totals_mismatch(self):
+        """✅ TEST: Per-unit mismatch is detected when start/end totals agree"""
+        log_content = """
+SCHEMA.PKG1 - execution start
+SCHEMA.PKG1 - execution start
+SCHEMA.PKG1 - execution end
+SCHEMA.PKG2 - execution end
+        """
+        metadata = self._stream_metadata(log_content, "Number of invalids at start: 0\nNumber of invalids at end: 0")
+        
+        validator = DeploymentValidator(metadata, self.config)
+        result = validator.validate_execution_integrity()
+
+        self.assertFalse(result)
+        self.assertTrue(validator.execution_mismatch)
+
     # ============ NEGATIVE TESTS ============
     
     def test_missing_main_log_file(self):
@@ -305,10 +377,9 @@ SCHEMA.PKG1 - execution end
     
     def test_malformed_invalid_counts(self):
         """❌ TEST: Handle malformed invalid count lines"""
-        self.main_log.write_text("OK")
-        self.invalid_log.write_text("Invalid log without proper format")
+        metadata = self._stream_metadata("OK", "Invalid log without proper format")
         
-        validator = DeploymentValidator(self.metadata, self.config)
+        validator = DeploymentValidator(metadata, self.config)
         result = validator.validate_invalid_delta()
         
         self.assertFalse(result)  # Should fail if counts not found
@@ -326,28 +397,49 @@ SCHEMA.PKG1 - execution end
     
     def test_multiple_error_codes_in_one_line(self):
         """❌ TEST: Handle multiple error codes in single line"""
-        self.main_log.write_text("Found errors: ORA-00001 and ORA-12514 in same line")
-        self.invalid_log.write_text("Number of invalids at start: 0\nNumber of invalids at end: 0")
+        metadata = self._stream_metadata("Found errors: ORA-00001 and ORA-12514 in same line", "Number of invalids at start: 0\nNumber of invalids at end: 0")
         
-        validator = DeploymentValidator(self.metadata, self.config)
+        validator = DeploymentValidator(metadata, self.config)
         result = validator.validate_errors()
         
         # Should capture ORA-00001
         self.assertIn("ORA-00001", validator.detected_errors)
 
+    def test_non_ascii_error_match_on_disk(self):
+        """❌ TEST: Non-ASCII bytes in a matched error code don't crash the mmap scan"""
+        # "ſ" (U+017F) case-folds to "s" under re2's Unicode (?i)
+        self.main_log.write_bytes(b"compilation error\xc5\xbf\nORA-12514: listener connection refused\n")
+        self.invalid_log.write_text("Number of invalids at start: 0\nNumber of invalids at end: 0")
+        metadata = dict(self.metadata, error_log_path=None)
+
+        validator = DeploymentValidator(metadata, self.config)
+        result = validator.validate_all()
+
+        self.assertEqual(result["status"], "FAIL")
+        self.assertIn("ORA-12514", validator.filtered_errors)
+        if validator_module.RE2_AVAILABLE:
+            self.assertIn("COMPILATION ERRORS", validator.detected_errors)
+
 
 class TestCycleManager(unittest.TestCase):
     """POSITIVE & NEGATIVE TESTS: Cycle Manager Module"""
+
+    @classmethod
+    def setUpClass(cls):
+        """One temp root per class; each test gets its own subdirectory"""
+        cls._root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Cleanup"""
+        shutil.rmtree(cls._root, ignore_errors=True)
     
     def setUp(self):
         """Setup test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = os.path.join(self._root, uuid.uuid4().hex)
+        os.makedirs(self.temp_dir)
         self.base_path = Path(self.temp_dir)
     
-    def tearDown(self):
-        """Cleanup"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_cycle_manager_generates_cycle_name(self):
         """✅ TEST: Generate cycle name with timestamp"""
         manager = CycleManager(self.base_path)
@@ -387,12 +479,168 @@ class TestCycleManager(unittest.TestCase):
             manager.ensure_cycle_folder("test_cycle")
 
 
-class TestConfiguration(unittest.TestCase):
-    """POSITIVE & NEGATIVE TESTS: Configuration Validation"""
-    
+class TestFolderMonitor(unittest.TestCase):
+    """POSITIVE & NEGATIVE TESTS: Folder Monitor settle window"""
+
     def setUp(self):
         """Setup test fixtures"""
-        self.config_path = Path(__file__).parent.parent / "config.json"
+        self.temp_dir = tempfile.mkdtemp()
+        self.monitor = FolderMonitor(self.temp_dir)
+        self.zip_file = Path(self.temp_dir) / "drop.zip"
+        self.zip_file.write_bytes(b"PK")
+
+    def tearDown(self):
+        """Cleanup"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_file_released_after_settle_window(self):
+        """✅ TEST: Unchanged file is handed out once the window has passed"""
+        fingerprint = self.monitor._get_file_fingerprint(self.zip_file)
+        pending = {self.zip_file: (fingerprint, 100.0)}
+
+        self.assertEqual(self.monitor._take_settled(pending, now=100.5), [])
+        self.assertIn(self.zip_file, pending)
+
+        settled = self.monitor._take_settled(pending, now=100.0 + folder_monitor.SETTLE_SECONDS)
+        self.assertEqual(settled, [self.zip_file])
+        self.assertEqual(pending, {})
+
+    def test_growing_file_restarts_settle_window(self):
+        """❌ TEST: File still being written is held back"""
+        pending = {self.zip_file: ((0, 0.0), 100.0)}
+
+        self.assertEqual(self.monitor._take_settled(pending, now=200.0), [])
+        self.assertEqual(pending[self.zip_file][1], 200.0)
+
+    def test_processed_duplicate_dropped(self):
+        """❌ TEST: Unchanged re-event of a processed file is skipped"""
+        self.monitor.mark_as_processed(self.zip_file)
+        fingerprint = self.monitor._get_file_fingerprint(self.zip_file)
+        pending = {self.zip_file: (fingerprint, 0.0)}
+
+        self.assertEqual(self.monitor._take_settled(pending, now=100.0), [])
+        self.assertEqual(pending, {})
+
+
+class TestLogAreaTrim(unittest.TestCase):
+    """POSITIVE TESTS: Tk log view line cap"""
+
+    def setUp(self):
+        """Setup test fixtures (needs a display)"""
+        import tkinter as tk
+        try:
+            self.root = tk.Tk()
+        except tk.TclError as e:
+            self.skipTest(f"Tk not available: {e}")
+        self.root.withdraw()
+        self.app = Mock()
+        self.app.log_area = tk.Text(self.root)
+        self.app.max_lines_var = tk.IntVar(self.root, value=3)
+
+    def tearDown(self):
+        """Cleanup"""
+        self.root.destroy()
+
+    def _log_lines(self):
+        return self.app.log_area.get("1.0", "end-1c").splitlines()
+
+    def test_trim_keeps_exactly_max_lines(self):
+        """✅ TEST: Oldest lines dropped down to the cap"""
+        from tk_app import DeploymentMonitorApp
+
+        self.app.log_area.insert("end", "".join(f"line {i}\n" for i in range(10)))
+        DeploymentMonitorApp._trim_log_area(self.app)
+
+        self.assertEqual(self._log_lines(), ["line 7", "line 8", "line 9"])
+
+    def test_trim_without_trailing_newline(self):
+        """✅ TEST: Cap holds when the last line is unterminated"""
+        from tk_app import DeploymentMonitorApp
+
+        self.app.log_area.insert("end", "\n".join(f"line {i}" for i in range(5)))
+        DeploymentMonitorApp._trim_log_area(self.app)
+
+        self.assertEqual(self._log_lines(), ["line 2", "line 3", "line 4"])
+
+
+class TestTkLogSignal(unittest.TestCase):
+    """NEGATIVE TESTS: Tk log signalling during shutdown (no display needed)"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        import queue
+        self.app = Mock()
+        self.app.log_queue = queue.Queue()
+        self.app._closing = False
+
+    def test_add_log_survives_mainloop_exit(self):
+        """❌ TEST: RuntimeError from a finished mainloop is absorbed"""
+        from tk_app import DeploymentMonitorApp
+        self.app.root.event_generate.side_effect = RuntimeError("main thread is not in main loop")
+
+        DeploymentMonitorApp.add_log(self.app, "late message")
+
+        self.assertTrue(self.app._closing)
+        self.assertEqual(self.app.log_queue.qsize(), 1)
+
+    def test_add_log_skips_tk_when_closing(self):
+        """✅ TEST: No cross-thread Tk call once closing"""
+        from tk_app import DeploymentMonitorApp
+        self.app._closing = True
+
+        DeploymentMonitorApp.add_log(self.app, "late message")
+
+        self.app.root.event_generate.assert_not_called()
+        self.assertEqual(self.app.log_queue.qsize(), 1)
+
+
+class TestSharedState(unittest.TestCase):
+    """POSITIVE TESTS: Shared log queue bounds"""
+
+    def setUp(self):
+        """Start from empty queues"""
+        shared_state.log_queue.clear()
+        shared_state.log_buffer.clear()
+        shared_state.dropped_logs = 0
+
+    def tearDown(self):
+        """Cleanup"""
+        self.setUp()
+
+    def test_drop_counter_reported_on_drain(self):
+        """✅ TEST: Overflowing the log queue yields one summary line"""
+        for i in range(shared_state.MAX_LOGS + 7):
+            shared_state.add_log(f"msg {i}")
+
+        self.assertEqual(shared_state.dropped_logs, 7)
+
+        shared_state.drain_queue()
+
+        self.assertEqual(shared_state.dropped_logs, 0)
+        self.assertIn("7 log messages dropped", shared_state.log_buffer[-1])
+
+    def test_no_summary_without_drops(self):
+        """✅ TEST: No summary line when nothing was dropped"""
+        shared_state.add_log("only message")
+        shared_state.drain_queue()
+
+        self.assertEqual(len(shared_state.log_buffer), 1)
+
+
+class TestConfiguration(unittest.TestCase):
+    """POSITIVE & NEGATIVE TESTS: Configuration Validation"""
+
+    config_path = Path(__file__).parent.parent / "config.json"
+
+    @classmethod
+    def setUpClass(cls):
+        """Parse config.json once for all configuration tests"""
+        cls._config = None
+        cls._config_error = None
+        try:
+            cls._config = json.loads(cls.config_path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            cls._config_error = e
     
     def test_config_file_exists(self):
         """✅ TEST: Config file exists"""
@@ -400,17 +648,13 @@ class TestConfiguration(unittest.TestCase):
     
     def test_config_valid_json(self):
         """✅ TEST: Config file is valid JSON"""
-        try:
-            with open(self.config_path) as f:
-                config = json.load(f)
-            self.assertIsInstance(config, dict)
-        except json.JSONDecodeError:
+        if isinstance(self._config_error, json.JSONDecodeError):
             self.fail("Config file is not valid JSON")
+        self.assertIsInstance(self._config, dict)
     
     def test_config_has_required_fields(self):
         """✅ TEST: Config has all required fields"""
-        with open(self.config_path) as f:
-            config = json.load(f)
+        config = self._config
         
         required_fields = ["base_audit_path", "poll_interval_seconds", "clusters", "ignorable_errors", "email_settings"]
         for field in required_fields:
@@ -418,10 +662,7 @@ class TestConfiguration(unittest.TestCase):
     
     def test_config_email_settings_structure(self):
         """✅ TEST: Email settings have correct structure"""
-        with open(self.config_path) as f:
-            config = json.load(f)
-        
-        email = config["email_settings"]
+        email = self._config["email_settings"]
         self.assertIn("enabled", email)
         self.assertIn("recipients", email)
         self.assertIn("subject_templates", email)
@@ -430,10 +671,7 @@ class TestConfiguration(unittest.TestCase):
     
     def test_config_clusters_valid(self):
         """✅ TEST: Clusters configuration is valid"""
-        with open(self.config_path) as f:
-            config = json.load(f)
-        
-        clusters = config["clusters"]
+        clusters = self._config["clusters"]
         self.assertIsInstance(clusters, dict)
         
         # Each cluster should have a list of instances
@@ -5,15 +5,47 @@ import time
 import json
 import os
 import queue
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+DEFAULT_MAX_LOG_LINES = 5000
+_STATUS_RE = re.compile(r"Status:\s+(PASS|FAIL)")
+
+
+def _load_core():
+    """
+    Import the processing modules on first service start.
+    Keeps zipfile/regex/extract_msg/pywin32 off the GUI startup path.
+    """
+    from core.folder_monitor import FolderMonitor, WATCHDOG_AVAILABLE
+    from core.zip_processor import ZipProcessor
+    from core.validator import DeploymentValidator
+    from core.jira_extractor import JiraExtractor
+    from core.archiver import Archiver
+    from core.cycle_manager import CycleManager
+    from core.email_sender import EmailSender
+    from core.msg_processor import MsgProcessor
+
+    return SimpleNamespace(
+        FolderMonitor=FolderMonitor,
+        WATCHDOG_AVAILABLE=WATCHDOG_AVAILABLE,
+        ZipProcessor=ZipProcessor,
+        DeploymentValidator=DeploymentValidator,
+        JiraExtractor=JiraExtractor,
+        Archiver=Archiver,
+        CycleManager=CycleManager,
+        EmailSender=EmailSender,
+        MsgProcessor=MsgProcessor,
+    )
 
-from core.folder_monitor import FolderMonitor
-from core.zip_processor import ZipProcessor
-from core.validator import DeploymentValidator
-from core.jira_extractor import JiraExtractor
-from core.archiver import Archiver
-from core.cycle_manager import CycleManager
-from core.email_sender import EmailSender
 
 class DeploymentMonitorApp:
     def __init__(self, root):
@@ -26,12 +58,28 @@ class DeploymentMonitorApp:
         self.send_email = False
         self.log_queue = queue.Queue()
         self.last_status = None
+        self._config = None
+        self._config_mtime = 0
+        self._pool = None
+        self._flush_pending = False
+        self._core = None
+        # Set once the window is going away; workers then stop poking Tk
+        self._closing = False
 
         self._setup_styles()
         self._create_widgets()
         
-        # Start queue polling
-        self.root.after(100, self._poll_log_queue)
+        # Drain the log queue only when a worker signals new messages
+        self.root.bind("<<LogReady>>", lambda e: self._schedule_drain())
+        self.root.after(1000, self._log_heartbeat)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        self._closing = True
+        self.service_running = False
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
     def _setup_styles(self):
         style = ttk.Style()
@@ -49,6 +97,11 @@ class DeploymentMonitorApp:
         style.configure("TLabel", background=self.bg_color, foreground=self.text_color, font=("Inter", 10))
         style.configure("Header.TLabel", background=self.card_bg, foreground=self.accent_color, font=("Playfair Display", 14, "bold"))
         style.configure("Status.TLabel", background=self.bg_color, foreground="#f2994a", font=("Inter", 11, "bold"))
+
+        # Deployment status variants, switched via style= instead of reconfiguring fg
+        style.configure("Idle.Status.TLabel", background=self.bg_color, foreground="#a0a0a0", font=("Inter", 12, "bold"))
+        style.configure("Pass.Status.TLabel", background=self.bg_color, foreground="#10b981", font=("Inter", 12, "bold"))
+        style.configure("Fail.Status.TLabel", background=self.bg_color, foreground="#ef4444", font=("Inter", 12, "bold"))
         
         style.configure("TButton", background=self.btn_bg, foreground="white", font=("Inter", 10, "bold"), borderwidth=0)
         style.map("TButton", background=[("active", "#667eea")])
@@ -88,6 +141,12 @@ class DeploymentMonitorApp:
         self.poll_spn = tk.Spinbox(config_card, from_=5, to=300, textvariable=self.poll_var, bg="#1a1a2e", fg="white", buttonbackground="#2b2d42", borderwidth=0, font=("Inter", 10))
         self.poll_spn.grid(row=3, column=1, sticky="w", padx=10, ipady=3, ipadx=10)
 
+        # Log line cap
+        ttk.Label(config_card, text="Max Log Lines:", background=self.card_bg).grid(row=4, column=0, sticky="w", pady=(10, 0))
+        self.max_lines_var = tk.IntVar(value=DEFAULT_MAX_LOG_LINES)
+        self.max_lines_spn = tk.Spinbox(config_card, from_=500, to=50000, increment=500, textvariable=self.max_lines_var, bg="#1a1a2e", fg="white", buttonbackground="#2b2d42", borderwidth=0, font=("Inter", 10))
+        self.max_lines_spn.grid(row=4, column=1, sticky="w", padx=10, pady=(10, 0), ipady=3, ipadx=10)
+
         config_card.columnconfigure(1, weight=1)
 
         # --- Email Notification Toggle ---
@@ -125,7 +184,7 @@ class DeploymentMonitorApp:
         # --- Deployment Status ---
         self.deploy_status_frame = ttk.Frame(main_frame, style="TFrame")
         self.deploy_status_frame.pack(fill="x", pady=5)
-        self.deploy_status_lbl = tk.Label(self.deploy_status_frame, text="📊 Latest Status: No deployment processed", bg=self.bg_color, fg="#a0a0a0", font=("Inter", 12, "bold"))
+        self.deploy_status_lbl = ttk.Label(self.deploy_status_frame, text="📊 Latest Status: No deployment processed", style="Idle.Status.TLabel")
         self.deploy_status_lbl.pack(anchor="w")
 
         # --- Logs ---
@@ -142,30 +201,76 @@ class DeploymentMonitorApp:
     def add_log(self, message):
         timestamp = time.strftime("%H:%M:%S")
         self.log_queue.put(f"[{timestamp}] {message}")
-
-    def _poll_log_queue(self):
+        if self._closing:
+            # No cross-thread Tk calls during shutdown; the heartbeat drains the queue
+            return
+        try:
+            self.root.event_generate("<<LogReady>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # Window destroyed (TclError) or mainloop over ("main thread is
+            # not in main loop"); stop signalling, the heartbeat drains the queue
+            self._closing = True
+
+    def _schedule_drain(self):
+        # Coalesce bursts of <<LogReady>> into at most one redraw per 50 ms
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.root.after(50, self._drain_log_queue)
+
+    def _drain_log_queue(self):
+        self._flush_pending = False
+        msgs = []
+        # Bind once; the loop below runs per queued message
+        append = msgs.append
+        get = self.log_queue.get_nowait
         try:
             while True:
-                msg = self.log_queue.get_nowait()
-                self.log_area.insert(tk.END, msg + "\n")
-                self.log_area.see(tk.END)
-                
-                # Check for status updates in log messages (simple integration)
-                if "Status: PASS" in msg:
-                    self.update_deploy_status("PASS")
-                elif "Status: FAIL" in msg:
-                    self.update_deploy_status("FAIL")
-                    
+                append(get())
         except queue.Empty:
             pass
-        finally:
-            self.root.after(100, self._poll_log_queue)
+
+        if not msgs:
+            return
+
+        # One insert and one scroll per drain instead of one per message
+        log_area = self.log_area
+        end = tk.END
+        text = "\n".join(msgs) + "\n"
+        log_area.insert(end, text)
+        self._trim_log_area()
+        log_area.see(end)
+
+        # Check for status updates in log messages (simple integration);
+        # one pass over the batch, the last status line wins
+        match = None
+        for match in _STATUS_RE.finditer(text):
+            pass
+        if match is not None:
+            self.update_deploy_status(match.group(1))
+
+    def _trim_log_area(self):
+        # Ring buffer: drop the oldest lines once the cap is exceeded
+        try:
+            max_lines = max(1, self.max_lines_var.get())
+        except tk.TclError:
+            max_lines = DEFAULT_MAX_LOG_LINES
+
+        # After a trailing newline the last text line is empty; don't count it
+        line, column = map(int, self.log_area.index("end-1c").split("."))
+        lines = line if column else line - 1
+        if lines > max_lines:
+            self.log_area.delete("1.0", f"{lines - max_lines + 1}.0")
+
+    def _log_heartbeat(self):
+        # Safety net in case a <<LogReady>> event was lost
+        self._drain_log_queue()
+        self.root.after(1000, self._log_heartbeat)
 
     def update_deploy_status(self, status):
         if status == "PASS":
-            self.deploy_status_lbl.config(text="📊 Latest Status: Deployment PASSED ✅", fg="#10b981")
+            self.deploy_status_lbl.configure(text="📊 Latest Status: Deployment PASSED ✅", style="Pass.Status.TLabel")
         else:
-            self.deploy_status_lbl.config(text="📊 Latest Status: Deployment FAILED ❌", fg="#ef4444")
+            self.deploy_status_lbl.configure(text="📊 Latest Status: Deployment FAILED ❌", style="Fail.Status.TLabel")
 
     def _on_email_toggle(self):
         self.send_email = self.email_var.get()
@@ -198,108 +303,158 @@ class DeploymentMonitorApp:
         self.status_lbl.config(text="Service Status: STOPPED", foreground="#f2994a")
         self.start_btn.config(state="normal")
         self.add_log("🛑 Stopping service...")
+        if self._pool is not None:
+            # Running ZIPs finish in the background; queued ones are dropped
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_config(self):
+        """Return the parsed config.json, re-reading it only when its mtime changes."""
+        config_path = Path("config.json")
+        try:
+            mtime = config_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        if self._config is None or mtime != self._config_mtime:
+            if ORJSON_AVAILABLE:
+                self._config = orjson.loads(config_path.read_bytes())
+            else:
+                with open(config_path, "r", encoding="utf-8") as f:
+                    self._config = json.load(f)
+            self._config_mtime = mtime
+        return self._config
+
+    def _process_one_file(self, file, incoming_path, config, archiver, archive_lock, monitor):
+        core = self._core
+        try:
+            self.add_log(f"Detected file: {file.name}")
+            zip_files = []
+            if file.suffix.lower() == ".msg":
+                self.add_log("Extracting ZIP from MSG...")
+                msg_p = core.MsgProcessor(file, incoming_path)
+                zip_files.extend(msg_p.extract_zip_attachments())
+            elif file.suffix.lower() == ".zip":
+                zip_files.append(file)
+
+            for zip_path in zip_files:
+                self.add_log(f"Processing ZIP: {zip_path.name}")
+                zip_p = core.ZipProcessor(zip_path, config)
+                meta = zip_p.process()
+
+                validator = core.DeploymentValidator(meta, config)
+                result = validator.validate_all()
+
+                status = result["status"]
+                self.add_log(f"Status: {status}")
+                self.add_log(f"Details: {result['message']}")
+                
+                # Display detailed error information
+                if result.get("error_details"):
+                    self.add_log("━ Error Details ━")
+                    for error in result["error_details"]:
+                        self.add_log(f"  • Unit: {error['unit']} | Code: {error['code']}")
+                        self.add_log(f"    Message: {error['message'][:100]}...")
+                
+                # Display invalid objects created
+                if result.get("invalid_objects"):
+                    self.add_log("━ Invalid Objects Created ━")
+                    for invalid in result["invalid_objects"]:
+                        self.add_log(f"  • Object: {invalid['object']} (Type: {invalid['type']})")
+
+                jira_extractor = core.JiraExtractor(meta["main_log_path"])
+                jira_units = jira_extractor.extract()
+
+                with archive_lock:
+                    archiver.archive(
+                        status=status,
+                        cluster=meta["cluster"],
+                        instance=meta["instance"],
+                        original_zip_path=zip_path,
+                        jira_units=jira_units
+                    )
+                
+                # Send email notification if enabled
+                if self.send_email:
+                    try:
+                        email_sender = core.EmailSender(config)
+                        success, email_msg = email_sender.send_deployment_summary(
+                            status=status,
+                            cluster=meta["cluster"],
+                            instance=meta["instance"],
+                            message=result["message"]
+                        )
+                                
+                        if success:
+                            self.add_log(f"📧 {email_msg}")
+                        else:
+                            self.add_log(f"⚠️ Email Error: {email_msg}")
+                    except Exception as e:
+                        self.add_log(f"⚠️ Email Exception: {str(e)}")
+                zip_p.cleanup()
+
+            monitor.mark_as_processed(file)
+        except Exception as e:
+            self.add_log(f"❌ Error processing {file.name}: {str(e)}")
 
     def run_service_task(self, incoming_path_str, base_path_str, interval):
         incoming_path = Path(incoming_path_str)
         base_audit_path = Path(base_path_str)
-        config_path = Path("config.json")
-
-        if not config_path.exists():
+        config = self._get_config()
+        if config is None:
             self.add_log("❌ config.json not found.")
             return
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        if self._core is None:
+            self._core = _load_core()
+        core = self._core
 
-        cycle_manager = CycleManager(base_audit_path)
+        cycle_manager = core.CycleManager(base_audit_path)
         cycle_name = cycle_manager.generate_cycle_name()
         cycle_manager.ensure_cycle_folder(cycle_name)
 
-        archiver = Archiver(base_audit_path, cycle_name)
+        archiver = core.Archiver(base_audit_path, cycle_name)
         
-        # Using Polling Folder Monitor
-        monitor = FolderMonitor(incoming_path, poll_interval=interval)
+        # Filesystem events via watchdog; polls every `interval` seconds without it
+        monitor = core.FolderMonitor(incoming_path, poll_interval=interval)
+        method = "Event" if core.WATCHDOG_AVAILABLE else "Polling"
+
+        self.add_log(f"✅ Service Started ({method} Method). {cycle_name}")
+
+        # One worker per detected file; archiving is serialized through a lock
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="zip-worker")
+        in_flight = set()
+        in_flight_lock = threading.Lock()
+        archive_lock = threading.Lock()
 
-        self.add_log(f"✅ Service Started (Polling Method). {cycle_name}")
+        def process(file):
+            try:
+                self._process_one_file(file, incoming_path, config, archiver, archive_lock, monitor)
+            finally:
+                with in_flight_lock:
+                    in_flight.discard(file.name)
 
         try:
-            for file in monitor.start_polling():
+            for file in monitor.start_watching(lambda: self.service_running):
                 if not self.service_running:
                     break
 
+                # A rescan may report a file that is still being processed
+                with in_flight_lock:
+                    if file.name in in_flight:
+                        continue
+                    in_flight.add(file.name)
                 try:
-                    self.add_log(f"Detected file: {file.name}")
-                    zip_files = []
-                    if file.suffix.lower() == ".msg":
-                        from core.msg_processor import MsgProcessor
-                        self.add_log("Extracting ZIP from MSG...")
-                        msg_p = MsgProcessor(file, incoming_path)
-                        zip_files.extend(msg_p.extract_zip_attachments())
-                    elif file.suffix.lower() == ".zip":
-                        zip_files.append(file)
-
-                    for zip_path in zip_files:
-                        self.add_log(f"Processing ZIP: {zip_path.name}")
-                        zip_p = ZipProcessor(zip_path, config)
-                        meta = zip_p.process()
-
-                        validator = DeploymentValidator(meta, config)
-                        result = validator.validate_all()
-
-                        status = result["status"]
-                        self.add_log(f"Status: {status}")
-                        self.add_log(f"Details: {result['message']}")
-                        
-                        # Display detailed error information
-                        if result.get("error_details"):
-                            self.add_log("━ Error Details ━")
-                            for error in result["error_details"]:
-                                self.add_log(f"  • Unit: {error['unit']} | Code: {error['code']}")
-                                self.add_log(f"    Message: {error['message'][:100]}...")
-                        
-                        # Display invalid objects created
-                        if result.get("invalid_objects"):
-                            self.add_log("━ Invalid Objects Created ━")
-                            for invalid in result["invalid_objects"]:
-                                self.add_log(f"  • Object: {invalid['object']} (Type: {invalid['type']})")
-
-                        jira_extractor = JiraExtractor(meta["main_log_path"])
-                        jira_units = jira_extractor.extract()
-
-                        archiver.archive(
-                            status=status,
-                            cluster=meta["cluster"],
-                            instance=meta["instance"],
-                            original_zip_path=zip_path,
-                            jira_units=jira_units
-                        )
-                        
-                        # Send email notification if enabled
-                        if self.send_email:
-                            try:
-                                email_sender = EmailSender(config)
-                                success, email_msg = email_sender.send_deployment_summary(
-                                    status=status,
-                                    cluster=meta["cluster"],
-                                    instance=meta["instance"],
-                                    message=result["message"]
-                                )
-                                
-                                if success:
-                                    self.add_log(f"📧 {email_msg}")
-                                else:
-                                    self.add_log(f"⚠️ Email Error: {email_msg}")
-                            except Exception as e:
-                                self.add_log(f"⚠️ Email Exception: {str(e)}")
-                        zip_p.cleanup()
-
-                    monitor.mark_as_processed(file)
-                except Exception as e:
-                    self.add_log(f"❌ Error processing {file.name}: {str(e)}")
+                    self._pool.submit(process, file)
+                except RuntimeError:
+                    # stop_service shut the pool down between checks
+                    break
         finally:
             self.add_log("🛑 Service Stopped.")
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = DeploymentMonitorApp(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app._closing = True
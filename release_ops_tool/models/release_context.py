@@ -25,7 +25,7 @@ class Platform(Enum):
     BITBUCKET = "bitbucket"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleaseContext:
     # -------------------------
     # UI / Session
@@ -7,11 +7,15 @@ Uses the AI provider configured in config/ai_config.yaml.
 """
 
 import json
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Dict, Any, Tuple
 
 from models.release_context import ReleaseContext, Intent, Environment, ReleaseType
 from services.ai_provider import get_ai_provider
 
+# Upper bound on how long the chat waits for the provider, retries included
+RESPONSE_TIMEOUT_SECONDS = 60
+
 
 class AgentService:
     def __init__(self):
@@ -72,7 +76,8 @@ Rules:
 """
         
         try:
-            raw_response = self.provider.query(prompt, system_prompt)
+            future = self.provider.query_async(prompt, system_prompt)
+            raw_response = future.result(timeout=RESPONSE_TIMEOUT_SECONDS)
             
             # Handle markdown code blocks
             json_str = raw_response.strip()
@@ -82,6 +87,8 @@ Rules:
             
             data = json.loads(json_str)
             
+        except FutureTimeoutError:
+            return "⏳ The AI service is taking too long. Please try again or use Manual UI mode.", {}, False
         except json.JSONDecodeError:
             # Non-JSON response - treat as conversational
             return raw_response if raw_response else "I'm here to help! Tell me about your release.", {}, False
@@ -7,16 +7,48 @@ Configure your company's AI in config/ai_config.yaml.
 """
 
 import os
+import re
+import random
 import yaml
 import json
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from typing import Optional
 from abc import ABC, abstractmethod
 
 
+# Shared worker pool for query_async; keeps slow backends off the UI thread
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ai-query")
+
+# MockAI keyword tables, built once at import
+_JIRA_RE = re.compile(r"([A-Z]+-\d+)", re.IGNORECASE)
+_CLUSTERS = ("SSA", "LDN", "WEU", "CEE", "CIST", "MENA", "POL")
+_TOKEN_RE = re.compile(r"[a-z0-9\-]+")
+_CONFIRM = frozenset({"yes", "confirm", "execute", "now"})
+_CONFIRM_PHRASE = "do it"
+_ENV_CIT = frozenset({"cit", "uat"})
+_ENV_BFX = frozenset({"bfx", "pre-prod"})
+
+
+class _JitteredRetry(Retry):
+    """Retry with exponential backoff capped at 30 s and 0.5x-1.5x jitter."""
+    
+    BACKOFF_CAP = 30
+    
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return min(backoff, self.BACKOFF_CAP) * (0.5 + random.random())
+
+
+@lru_cache(maxsize=1)
 def load_ai_config() -> dict:
-    """Load AI configuration from YAML file."""
+    """Load AI configuration from YAML file (cached; call cache_clear() to reload)."""
     config_path = Path("config/ai_config.yaml")
     if config_path.exists():
         with open(config_path, "r", encoding="utf-8") as f:
@@ -31,6 +63,10 @@ class AIProvider(ABC):
     def query(self, prompt: str, system_prompt: str = None) -> str:
         """Send a prompt and return the response."""
         pass
+    
+    def query_async(self, prompt: str, system_prompt: str = None) -> Future:
+        """Run query() on the shared worker pool and return its Future."""
+        return _executor.submit(self.query, prompt, system_prompt)
 
 
 class MockAI(AIProvider):
@@ -40,29 +76,27 @@ class MockAI(AIProvider):
     """
     
     def query(self, prompt: str, system_prompt: str = None) -> str:
-        import re
         prompt_lower = prompt.lower()
         
         # Pattern matching for common intents
-        jira_match = re.search(r"([A-Z]+-\d+)", prompt, re.IGNORECASE)
+        jira_match = _JIRA_RE.search(prompt)
         jira = jira_match.group(1).upper() if jira_match else None
         
+        # Tokenize once; keywords below are set lookups on whole words
+        tokens = set(_TOKEN_RE.findall(prompt_lower))
+        
         # Detect environment
         env = None
-        if "cit" in prompt_lower or "uat" in prompt_lower:
+        if tokens & _ENV_CIT:
             env = "CIT"
-        elif "bfx" in prompt_lower or "pre-prod" in prompt_lower:
+        elif tokens & _ENV_BFX:
             env = "BFX"
         
         # Detect cluster
-        cluster = None
-        for c in ["ssa", "ldn", "weu", "cee", "cist", "mena", "pol"]:
-            if c in prompt_lower:
-                cluster = c.upper()
-                break
+        cluster = next((c for c in _CLUSTERS if c.lower() in tokens), None)
         
         # Detect confirmation
-        confirm = any(word in prompt_lower for word in ["yes", "confirm", "do it", "execute", "now"])
+        confirm = bool(tokens & _CONFIRM) or _CONFIRM_PHRASE in prompt_lower
         
         # Build response
         if jira or env or cluster or confirm:
@@ -102,13 +136,29 @@ class CustomAI(AIProvider):
         self.model = api_config.get("model", "gpt-4")
         self.timeout = api_config.get("timeout", 30)
         self.max_tokens = api_config.get("max_tokens", 1024)
-        self.headers = config.get("headers", {"Content-Type": "application/json"})
+        # Copy so the Authorization header never leaks into the cached config
+        self.headers = dict(config.get("headers", {"Content-Type": "application/json"}))
         
         # Add authorization header if API key is set
         if self.api_key:
             self.headers["Authorization"] = f"Bearer {self.api_key}"
         
         self.retry_config = config.get("retry", {"max_attempts": 3, "delay_seconds": 2})
+        
+        # Pooled keep-alive session; retries happen inside the adapter
+        max_attempts = self.retry_config.get("max_attempts", 3)
+        # Only connection errors, timeouts and 502/503/504 are retried; other statuses fail fast
+        retry = _JitteredRetry(
+            total=max(max_attempts - 1, 0),
+            backoff_factor=self.retry_config.get("delay_seconds", 2),
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def query(self, prompt: str, system_prompt: str = None) -> str:
         """
@@ -116,8 +166,6 @@ class CustomAI(AIProvider):
         
         Modify this method to match your API's request/response format.
         """
-        import time
-        
         # Build request payload
         # =====================
         # CUSTOMIZE THIS TO MATCH YOUR API FORMAT
@@ -133,58 +181,47 @@ class CustomAI(AIProvider):
             "max_tokens": self.max_tokens
         }
         
-        # Send request with retry
-        max_attempts = self.retry_config.get("max_attempts", 3)
-        delay = self.retry_config.get("delay_seconds", 2)
-        
-        for attempt in range(max_attempts):
-            try:
-                response = requests.post(
-                    self.url,
-                    headers=self.headers,
-                    json=payload,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                
-                # Parse response
-                # =====================
-                # CUSTOMIZE THIS TO MATCH YOUR API RESPONSE FORMAT
-                # =====================
-                data = response.json()
-                
-                # OpenAI-compatible format
-                if "choices" in data:
-                    return data["choices"][0]["message"]["content"]
-                
-                # Simple format
-                if "response" in data:
-                    return data["response"]
-                
-                if "text" in data:
-                    return data["text"]
-                
-                # Return raw response
-                return json.dumps(data)
-                
-            except requests.exceptions.RequestException as e:
-                if attempt < max_attempts - 1:
-                    time.sleep(delay)
-                    continue
-                
-                # Return friendly error as JSON
-                return json.dumps({
-                    "intent": "CHAT",
-                    "entities": {},
-                    "confirm": False,
-                    "needs_clarification": False,
-                    "message": f"⚠️ AI service unavailable. Please try again or use Manual UI mode."
-                })
+        try:
+            response = self.session.post(self.url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            
+            # Parse response
+            # =====================
+            # CUSTOMIZE THIS TO MATCH YOUR API RESPONSE FORMAT
+            # =====================
+            data = response.json()
+            
+            # OpenAI-compatible format
+            if "choices" in data:
+                return data["choices"][0]["message"]["content"]
+            
+            # Simple format
+            if "response" in data:
+                return data["response"]
+            
+            if "text" in data:
+                return data["text"]
+            
+            # Return raw response
+            return json.dumps(data)
+            
+        except requests.exceptions.RequestException as e:
+            # Return friendly error as JSON
+            return json.dumps({
+                "intent": "CHAT",
+                "entities": {},
+                "confirm": False,
+                "needs_clarification": False,
+                "message": f"⚠️ AI service unavailable. Please try again or use Manual UI mode."
+            })
 
 
+@lru_cache(maxsize=1)
 def get_ai_provider() -> AIProvider:
     """
     Factory function to get the configured AI provider.
+    
+    The provider (and its pooled HTTP session) is shared across reruns.
     """
     config = load_ai_config()
     mode = config.get("mode", "MOCK").upper()
@@ -1,6 +1,9 @@
+import os
 import subprocess
+import threading
+import weakref
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 
 
 class GitCommandError(Exception):
@@ -13,6 +16,51 @@ class GitCommandError(Exception):
         self.stderr = stderr
 
 
+# Subcommands that never need to write the repository. With
+# GIT_OPTIONAL_LOCKS=0 they skip the opportunistic index.lock refresh
+# (notably `git status`), so they neither wait on nor block a concurrent
+# writer
+_READ_ONLY_COMMANDS = frozenset(
+    {"status", "rev-parse", "branch", "hash-object", "diff", "show"}
+)
+
+
+def _git_env(args: List[str]) -> Optional[Dict[str, str]]:
+    """Environment for `args`: no optional locks for read-only subcommands."""
+    if len(args) > 1 and args[1] in _READ_ONLY_COMMANDS:
+        return {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+    return None
+
+
+def _run_git_command_bytes(
+    args: List[str],
+    repo_path: Path,
+    check: bool = True
+) -> bytes:
+    """
+    Run a git command and return its stripped stdout undecoded, for callers
+    that only compare hashes or test for empty output.
+    """
+
+    process = subprocess.run(
+        args,
+        cwd=repo_path,
+        env=_git_env(args),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+
+    if check and process.returncode != 0:
+        raise GitCommandError(
+            message="Git command failed",
+            command=args,
+            stdout=process.stdout.decode("utf-8", errors="replace").strip(),
+            stderr=process.stderr.decode("utf-8", errors="replace").strip()
+        )
+
+    return process.stdout.strip()
+
+
 def _run_git_command(
     args: List[str],
     repo_path: Path,
@@ -20,14 +68,18 @@ def _run_git_command(
 ) -> str:
     """
     Internal helper to run git commands safely.
+    Output is decoded as UTF-8; undecodable bytes (legacy-encoded paths or
+    author names) are replaced rather than raising.
     """
 
     process = subprocess.run(
         args,
         cwd=repo_path,
+        env=_git_env(args),
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True
+        encoding="utf-8",
+        errors="replace"
     )
 
     if check and process.returncode != 0:
@@ -41,34 +93,189 @@ def _run_git_command(
     return process.stdout.strip()
 
 
+# -------------------------
+# Persistent object reader
+# -------------------------
+
+class GitCatFile:
+    """
+    Long-lived `git cat-file --batch` process for one repository.
+
+    Each lookup is one line written to the same process instead of a new
+    git invocation. The process exits when the object is garbage collected
+    or close() is called.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self._lock = threading.Lock()
+        self._process = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+
+    def read(
+        self,
+        ref: str,
+        obj_type: Optional[str] = "blob"
+    ) -> Optional[Tuple[str, bytes]]:
+        """
+        Return (object hash, raw content) for `ref`, or None if it does not
+        exist or is not of `obj_type` (pass None to accept any type).
+        """
+        if "\n" in ref:
+            raise ValueError(f"Invalid object name: {ref!r}")
+
+        with self._lock:
+            stdin, stdout = self._process.stdin, self._process.stdout
+            try:
+                stdin.write(ref.encode("utf-8") + b"\n")
+                stdin.flush()
+                header = stdout.readline()
+            except (BrokenPipeError, OSError) as e:
+                raise GitCommandError("git cat-file exited", ["git", "cat-file", "--batch"], "", str(e))
+
+            if not header:
+                raise GitCommandError("git cat-file exited", ["git", "cat-file", "--batch"], "", "")
+
+            header = header.rstrip(b"\n")
+            # "<ref> missing" / "<ref> ambiguous"; the ref itself may contain
+            # spaces, so match the suffix rather than counting fields
+            if header.endswith((b" missing", b" ambiguous")):
+                return None
+
+            oid, found_type, size = header.rsplit(b" ", 2)
+            content = stdout.read(int(size))
+            stdout.read(1)  # trailing newline
+            if obj_type is not None and found_type.decode("ascii") != obj_type:
+                # e.g. a directory path resolving to a tree
+                return None
+            return oid.decode("ascii"), content
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """Return the object hash `ref` points to, or None if it does not exist."""
+        result = self.read(ref, obj_type=None)
+        return result[0] if result else None
+
+    def close(self) -> None:
+        if self._process.poll() is None:
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+
+    def __del__(self):
+        self.close()
+
+
+# One reader per repo, alive only while some caller holds it
+_cat_files: "weakref.WeakValueDictionary[Path, GitCatFile]" = weakref.WeakValueDictionary()
+_cat_files_lock = threading.Lock()
+
+
+def get_cat_file(repo_path: Path) -> GitCatFile:
+    """
+    Return the live GitCatFile for `repo_path`, starting one if needed.
+    Hold the returned object for as long as lookups are needed.
+    """
+    with _cat_files_lock:
+        cat_file = _cat_files.get(repo_path)
+        if cat_file is None:
+            cat_file = GitCatFile(repo_path)
+            _cat_files[repo_path] = cat_file
+        return cat_file
+
+
 # -------------------------
 # Read-only helpers
 # -------------------------
 
+# Remote-tracking heads only move on fetch/pull/push, so lookups are cached
+# per (repo, branch) until one of those runs; confirmed repos stay confirmed,
+# and the checked-out branch is remembered until checkout() moves it
+_remote_head_cache: Dict[Tuple[Path, str], str] = {}
+_known_repos: Set[Path] = set()
+_current_branch_cache: Dict[Path, str] = {}
+
+
+def clear_remote_head_cache(repo_path: Path) -> None:
+    """Forget cached remote heads for `repo_path` (after it talked to the remote)."""
+    for key in [key for key in _remote_head_cache if key[0] == repo_path]:
+        _remote_head_cache.pop(key, None)
+
+
 def get_current_branch(repo_path: Path) -> str:
-    return _run_git_command(
-        ["git", "branch", "--show-current"],
-        repo_path
-    )
+    """
+    Current branch name, cached until this process checks out another branch.
+    Checkouts made outside the tool are not seen until then.
+    """
+    branch = _current_branch_cache.get(repo_path)
+    if branch is None:
+        branch = _run_git_command(
+            ["git", "branch", "--show-current"],
+            repo_path
+        )
+        _current_branch_cache[repo_path] = branch
+    return branch
 
 
 def is_repo(repo_path: Path) -> bool:
+    """
+    Standalone repository probe. Where another git command follows anyway,
+    run that command and check is_not_repo_error() on failure instead.
+    """
+    if repo_path in _known_repos:
+        return True
+
     try:
         _run_git_command(
             ["git", "rev-parse", "--is-inside-work-tree"],
             repo_path
         )
-        return True
     except GitCommandError:
         return False
 
+    _known_repos.add(repo_path)
+    return True
+
+
+def is_not_repo_error(error: GitCommandError) -> bool:
+    """True if a git command failed because its cwd is not inside a repository."""
+    return "not a git repository" in error.stderr.lower()
 
-def is_working_tree_clean(repo_path: Path) -> bool:
-    status = _run_git_command(
+
+def is_working_tree_clean(
+    repo_path: Path,
+    check_untracked: bool = True
+) -> bool:
+    """
+    True if nothing differs from HEAD.
+
+    With check_untracked=False only tracked files are compared, via the
+    exit code of `git diff --quiet HEAD`, which skips the untracked-file
+    directory walk. The release gate keeps the default: `git add .` would
+    pick up untracked files, so they count as changes there.
+    """
+    if not check_untracked:
+        args = ["git", "diff", "--quiet", "HEAD", "--"]
+        process = subprocess.run(
+            args,
+            cwd=repo_path,
+            env=_git_env(args),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        return process.returncode == 0
+
+    status = _run_git_command_bytes(
         ["git", "status", "--porcelain"],
         repo_path
     )
-    return status == ""
+    return status == b""
 
 
 def get_remote_branch_head(
@@ -77,11 +284,26 @@ def get_remote_branch_head(
 ) -> str:
     """
     Get commit hash of remote branch HEAD.
+    Cached until the next fetch/pull/push; uses a live GitCatFile for the
+    repo if one is open.
     """
-    return _run_git_command(
-        ["git", "rev-parse", f"origin/{branch}"],
-        repo_path
-    )
+    key = (repo_path, branch)
+    head = _remote_head_cache.get(key)
+    if head is not None:
+        return head
+
+    cat_file = _cat_files.get(repo_path)
+    if cat_file is not None:
+        head = cat_file.resolve(f"origin/{branch}")
+
+    if head is None:
+        head = _run_git_command_bytes(
+            ["git", "rev-parse", f"origin/{branch}"],
+            repo_path
+        ).decode("ascii")
+
+    _remote_head_cache[key] = head
+    return head
 
 
 def get_file_blob_hash(
@@ -91,10 +313,10 @@ def get_file_blob_hash(
     """
     Get blob hash of a file in working tree.
     """
-    return _run_git_command(
+    return _run_git_command_bytes(
         ["git", "hash-object", file_path],
         repo_path
-    )
+    ).decode("ascii")
 
 
 # -------------------------
@@ -102,10 +324,12 @@ def get_file_blob_hash(
 # -------------------------
 
 def fetch(repo_path: Path) -> None:
+    clear_remote_head_cache(repo_path)
     _run_git_command(["git", "fetch"], repo_path)
 
 
 def checkout(branch: str, repo_path: Path) -> None:
+    _current_branch_cache.pop(repo_path, None)
     _run_git_command(["git", "checkout", branch], repo_path)
 
 
@@ -114,8 +338,9 @@ def checkout_new_branch(
     base_branch: str,
     repo_path: Path
 ) -> None:
+    _current_branch_cache.pop(repo_path, None)
     _run_git_command(["git", "checkout", base_branch], repo_path)
-    _run_git_command(["git", "pull"], repo_path)
+    pull(repo_path)
     _run_git_command(["git", "checkout", "-b", branch], repo_path)
 
 
@@ -128,14 +353,16 @@ def add_files(files: List[str], repo_path: Path) -> None:
 
 
 def commit(message: str, repo_path: Path) -> None:
-    _run_git_command(["git", "commit", "-m", message], repo_path)
+    _run_git_command(["git", "commit", "--quiet", "-m", message], repo_path)
 
 
 def push(branch: str, repo_path: Path) -> None:
-    _run_git_command(["git", "push", "-u", "origin", branch], repo_path)
+    clear_remote_head_cache(repo_path)
+    _run_git_command(["git", "push", "--quiet", "-u", "origin", branch], repo_path)
 
 
 def pull(repo_path: Path) -> None:
+    clear_remote_head_cache(repo_path)
     _run_git_command(["git", "pull"], repo_path)
 
 
@@ -143,10 +370,25 @@ def pull(repo_path: Path) -> None:
 # Clone
 # -------------------------
 
-def clone(repo_url: str, target_path: Path) -> None:
+def clone(repo_url: str, target_path: Path, shallow: bool = True) -> None:
+    """
+    Clone without file history: a partial clone (--filter=blob:none) only
+    downloads blobs for the checked-out tree, fetching others on demand.
+
+    shallow=True also truncates commit history to each branch tip
+    (--depth=1, all branches kept). Anything that needs older commits,
+    such as a rollback to an earlier state, must run
+    `git fetch --unshallow` in the repo first.
+    """
     target_path.parent.mkdir(parents=True, exist_ok=True)
+
+    args = ["git", "clone", "--filter=blob:none", "--no-tags"]
+    if shallow:
+        # --depth implies --single-branch; releases check out other base branches
+        args += ["--depth=1", "--no-single-branch"]
+
     subprocess.run(
-        ["git", "clone", repo_url, str(target_path)],
+        [*args, repo_url, str(target_path)],
         check=True
     )
 
@@ -189,6 +431,29 @@ def stage_all(repo_path: Path) -> None:
     _run_git_command(["git", "add", "."], repo_path)
 
 
+def has_staged_changes(repo_path: Path) -> bool:
+    """True if the index differs from HEAD (exit code of `git diff --cached --quiet`)."""
+    args = ["git", "diff", "--cached", "--quiet"]
+    process = subprocess.run(
+        args,
+        cwd=repo_path,
+        env=_git_env(args),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+    if process.returncode not in (0, 1):
+        raise GitCommandError(
+            message="Git command failed",
+            command=args,
+            stdout="",
+            stderr=process.stderr.strip()
+        )
+
+    return process.returncode == 1
+
+
 def commit_changes(repo_path: Path, message: str) -> None:
     commit(message, repo_path)
 
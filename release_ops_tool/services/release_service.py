@@ -1,18 +1,28 @@
 # services/release_service.py
 
+import filecmp
+import shutil
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+# libyaml's C loader when PyYAML was built with it; same semantics as SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from models.release_context import ReleaseContext
 from validators.drift_validator import validate_no_drift, DriftDetectedError
 from validators.repo_validator import ensure_clean_working_tree
 
 from services.git_service import (
-    checkout_branch,
     create_or_checkout_branch,
     stage_all,
     commit_changes,
-    push_branch,
-    GitCommandError
+    has_staged_changes,
+    push_branch
 )
 
 # Optional: Import logger if you added utils/logger.py
@@ -25,13 +35,17 @@ except (ImportError, ModuleNotFoundError):
     logger = None  # Define logger as None when import fails
 
 
-def load_file_routing() -> dict:
-    """Load extension-to-folder mappings."""
+@lru_cache(maxsize=1)
+def load_file_routing() -> MappingProxyType:
+    """
+    Load extension-to-folder mappings (read-only, parsed once per process;
+    call load_file_routing.cache_clear() after editing the YAML).
+    """
     try:
         with open("config/file_routing.yaml", "r", encoding="utf-8") as f:
-            return yaml.safe_load(f).get("mappings", {})
+            return MappingProxyType(yaml.load(f, Loader=_YamlLoader).get("mappings", {}))
     except (FileNotFoundError, yaml.YAMLError):
-        return {}
+        return MappingProxyType({})
 
 
 def execute_release(context: ReleaseContext) -> None:
@@ -76,13 +90,8 @@ def execute_release(context: ReleaseContext) -> None:
     # ======================================================
     # 🧭 Git flow
     # ======================================================
-    # Checkout base branch
-    checkout_branch(context.repo_path, context.base_branch)
-
-    if LOGGING_ENABLED and logger:
-        logger.info(f"Checked out base branch: {context.base_branch}")
-
-    # Create or checkout release branch
+    # Create or checkout release branch (a new branch is cut from a freshly
+    # pulled base inside checkout_new_branch, so no separate base checkout)
     create_or_checkout_branch(
         repo_path=context.repo_path,
         branch_name=context.release_branch,
@@ -100,25 +109,44 @@ def execute_release(context: ReleaseContext) -> None:
     # ======================================================
     routing_map = load_file_routing()
 
-    for rel_string in context.approved_files.keys():
-        rel_path = Path(rel_string)
-        src = context.shared_retro_path / rel_path
-        
-        # Determine destination
+    def _resolve_destination(rel_path: Path) -> Path:
         # If file is in root of retro folder (no parent parts), apply routing
         if len(rel_path.parts) == 1 and rel_path.suffix in routing_map:
             target_folder = routing_map[rel_path.suffix]
-            dst = context.repo_path / target_folder / rel_path.name
-        else:
-            # Respect existing structure
-            dst = context.repo_path / rel_path
+            return context.repo_path / target_folder / rel_path.name
+        # Respect existing structure
+        return context.repo_path / rel_path
+
+    pairs = []
+    for rel_string in context.approved_files.keys():
+        rel_path = Path(rel_string)
+        pairs.append((rel_path, context.shared_retro_path / rel_path, _resolve_destination(rel_path)))
+
+    # Create each distinct parent once, shallowest first so nested ones
+    # find their ancestors already in place
+    for parent in sorted({dst.parent for _, _, dst in pairs}, key=lambda p: len(p.parts)):
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def _apply_one(pair) -> None:
+        rel_path, src, dst = pair
+        # Re-runs: leave files that already match untouched (size check
+        # first, then an 8 KB buffered compare)
+        if dst.exists() and filecmp.cmp(src, dst, shallow=False):
+            if LOGGING_ENABLED and logger:
+                logger.info(f"Unchanged, skipped: {rel_path}")
+            return
 
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        dst.write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
+        # Byte-for-byte copy (kernel-side where supported); no decode/encode
+        shutil.copyfile(src, dst)
 
         if LOGGING_ENABLED and logger:
             logger.info(f"Applied file: {rel_path}")
 
+    # Copies are independent and I/O-bound; map() re-raises the first failure
+    if pairs:
+        with ThreadPoolExecutor(max_workers=min(32, len(pairs))) as executor:
+            list(executor.map(_apply_one, pairs))
+
     # -----------------------------
     # Commit message enforcement
     # -----------------------------
@@ -132,24 +160,22 @@ def execute_release(context: ReleaseContext) -> None:
     # ======================================================
     stage_all(context.repo_path)
 
-    try:
-        commit_changes(
-            context.repo_path,
-            message=context.release_jira
-        )
-        
+    # Index-only check, no output parsing: an empty index diff means the
+    # approved files already match the repository
+    if not has_staged_changes(context.repo_path):
         if LOGGING_ENABLED and logger:
-            logger.info(f"Committed changes with message: {context.release_jira}")
+            logger.warning("Nothing to commit - release skipped.")
 
-    except GitCommandError as e:
-        if "nothing to commit" in e.stdout.lower():
-            if LOGGING_ENABLED and logger:
-                logger.warning("Nothing to commit - release skipped.")
-            
-            # Raise a specific message that the UI can catch or display as a warning
-            raise RuntimeWarning("⚠️ Release skipped: No changes to commit. The files match the current repository state.")
-        else:
-            raise e
+        # Raise a specific message that the UI can catch or display as a warning
+        raise RuntimeWarning("⚠️ Release skipped: No changes to commit. The files match the current repository state.")
+
+    commit_changes(
+        context.repo_path,
+        message=context.release_jira
+    )
+
+    if LOGGING_ENABLED and logger:
+        logger.info(f"Committed changes with message: {context.release_jira}")
 
     push_branch(
         context.repo_path,
@@ -36,12 +36,16 @@ def refresh_repo(
     Fetch and pull latest changes on base branch.
     """
 
-    if not git_service.is_repo(local_path):
-        raise RepoSyncError(
-            f"Not a git repository: {local_path}"
-        )
+    # No separate is_repo probe: fetch fails the same way on a non-repo
+    try:
+        git_service.fetch(local_path)
+    except git_service.GitCommandError as e:
+        if git_service.is_not_repo_error(e):
+            raise RepoSyncError(
+                f"Not a git repository: {local_path}"
+            ) from e
+        raise
 
-    git_service.fetch(local_path)
     git_service.checkout(base_branch, local_path)
     git_service.pull(local_path)
 
@@ -1,11 +1,18 @@
+import subprocess
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
 from pathlib import Path
 from services.git_service import (
     get_remote_branch_head,
     get_file_blob_hash,
+    fetch,
+    commit,
+    clone,
+    GitCatFile,
     GitCommandError,
-    _run_git_command
+    _run_git_command,
+    _remote_head_cache
 )
 
 
@@ -14,12 +21,19 @@ def mock_repo_path():
     return Path("/tmp/mock_repo")
 
 
+@pytest.fixture(autouse=True)
+def clear_head_cache():
+    _remote_head_cache.clear()
+    yield
+    _remote_head_cache.clear()
+
+
 @patch("subprocess.run")
 def test_get_remote_branch_head_success(mock_run, mock_repo_path):
     # Setup mock
     mock_process = MagicMock()
     mock_process.returncode = 0
-    mock_process.stdout = "abc123456789\n"
+    mock_process.stdout = b"abc123456789\n"
     mock_run.return_value = mock_process
 
     # Test
@@ -30,9 +44,9 @@ def test_get_remote_branch_head_success(mock_run, mock_repo_path):
     mock_run.assert_called_with(
         ["git", "rev-parse", "origin/main"],
         cwd=mock_repo_path,
+        env=ANY,
         stdout=-1,
-        stderr=-1,
-        text=True
+        stderr=-1
     )
 
 
@@ -41,8 +55,8 @@ def test_get_remote_branch_head_failure(mock_run, mock_repo_path):
     # Setup mock failure
     mock_process = MagicMock()
     mock_process.returncode = 128
-    mock_process.stdout = ""
-    mock_process.stderr = "fatal: ambiguous argument..."
+    mock_process.stdout = b""
+    mock_process.stderr = b"fatal: ambiguous argument..."
     mock_run.return_value = mock_process
 
     # Test
@@ -57,7 +71,7 @@ def test_get_remote_branch_head_failure(mock_run, mock_repo_path):
 def test_get_file_blob_hash(mock_run, mock_repo_path):
     mock_process = MagicMock()
     mock_process.returncode = 0
-    mock_process.stdout = "def456\n"
+    mock_process.stdout = b"def456\n"
     mock_run.return_value = mock_process
 
     result = get_file_blob_hash(mock_repo_path, "file.txt")
@@ -66,7 +80,83 @@ def test_get_file_blob_hash(mock_run, mock_repo_path):
     mock_run.assert_called_with(
         ["git", "hash-object", "file.txt"],
         cwd=mock_repo_path,
+        env=ANY,
         stdout=-1,
-        stderr=-1,
-        text=True
+        stderr=-1
     )
+
+
+@patch("subprocess.run")
+def test_get_remote_branch_head_uses_live_cat_file(mock_run, mock_repo_path):
+    cat_file = MagicMock()
+    cat_file.resolve.return_value = "fed987"
+
+    with patch("services.git_service._cat_files", {mock_repo_path: cat_file}):
+        result = get_remote_branch_head(mock_repo_path, "main")
+
+    assert result == "fed987"
+    cat_file.resolve.assert_called_once_with("origin/main")
+    mock_run.assert_not_called()
+
+
+@patch("subprocess.run")
+def test_get_remote_branch_head_cached_until_fetch(mock_run, mock_repo_path):
+    mock_process = MagicMock()
+    mock_process.returncode = 0
+    mock_process.stdout = b"abc123\n"
+    mock_run.return_value = mock_process
+
+    assert get_remote_branch_head(mock_repo_path, "main") == "abc123"
+    assert get_remote_branch_head(mock_repo_path, "main") == "abc123"
+    assert mock_run.call_count == 1
+
+    fetch(mock_repo_path)
+    get_remote_branch_head(mock_repo_path, "main")
+    assert mock_run.call_count == 3
+
+
+@patch("subprocess.run")
+def test_read_only_commands_skip_optional_locks(mock_run, mock_repo_path):
+    mock_process = MagicMock()
+    mock_process.returncode = 0
+    mock_process.stdout = b"abc123\n"
+    mock_run.return_value = mock_process
+
+    get_remote_branch_head(mock_repo_path, "main")
+    assert mock_run.call_args.kwargs["env"]["GIT_OPTIONAL_LOCKS"] == "0"
+
+    commit("BANKING-1", mock_repo_path)
+    assert mock_run.call_args.kwargs["env"] is None
+
+
+@patch("subprocess.run")
+def test_clone_is_partial_and_shallow(mock_run, tmp_path):
+    target = tmp_path / "repos" / "demo"
+
+    clone("https://example.com/demo.git", target)
+
+    args = mock_run.call_args.args[0]
+    assert "--filter=blob:none" in args
+    assert "--depth=1" in args
+    assert args[-2:] == ["https://example.com/demo.git", str(target)]
+
+
+def test_cat_file_paths_with_spaces(tmp_path):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "one space.sql").write_text("select 1;\n")
+    git("add", ".")
+    git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init")
+
+    cat_file = GitCatFile(tmp_path)
+    try:
+        # "<ref> missing" with one space in the path must not be read as a header
+        assert cat_file.read("HEAD:dir/two words.sql") is None
+        assert cat_file.read("HEAD:dir/one space.sql")[1] == b"select 1;\n"
+        assert cat_file.read("HEAD:dir") is None
+        assert cat_file.resolve("HEAD") is not None
+    finally:
+        cat_file.close()
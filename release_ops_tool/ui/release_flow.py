@@ -2,8 +2,15 @@
 
 import streamlit as st
 import yaml
+from functools import lru_cache
 from pathlib import Path
 
+# libyaml's C loader when PyYAML was built with it; same semantics as SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from models.release_context import ReleaseContext, ReleaseType
 from services.release_service import execute_release
 from validators.drift_validator import (
@@ -13,9 +20,11 @@ from validators.drift_validator import (
 )
 
 
+@lru_cache(maxsize=1)
 def load_clusters_config() -> dict:
+    # Parsed once per process; Streamlit reruns share the (read-only) result
     with open("config/clusters.yaml", "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)["clusters"]
+        return yaml.load(f, Loader=_YamlLoader)["clusters"]
 
 
 def render_cluster_selector(context):
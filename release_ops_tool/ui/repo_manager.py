@@ -2,14 +2,23 @@
 
 import streamlit as st
 import yaml
+from functools import lru_cache
 from pathlib import Path
 
+# libyaml's C loader when PyYAML was built with it; same semantics as SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from services.repo_sync_service import ensure_repo_cloned, refresh_repo
 
 
+@lru_cache(maxsize=1)
 def load_clusters_config() -> dict:
+    # Parsed once per process; Streamlit reruns share the (read-only) result
     with open("config/clusters.yaml", "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)["clusters"]
+        return yaml.load(f, Loader=_YamlLoader)["clusters"]
 
 
 def render_repo_manager() -> None:
@@ -9,7 +9,7 @@ from typing import Optional, Tuple
 from models.release_context import ReleaseContext
 from services.approval_service import create_approval_record
 from utils.hashing import calculate_file_hash
-from services.git_service import get_remote_branch_head, is_repo
+from services.git_service import GitCommandError, get_remote_branch_head, is_not_repo_error
 
 
 def render_review_approval(context: ReleaseContext) -> None:
@@ -215,21 +215,22 @@ Folders for comparison:
                     )
                     return
 
-                if not is_repo(context.repo_path):
-                    st.error(
-                        f"❌ Invalid git repository at: `{context.repo_path}`\n\n"
-                        "👉 **Action Required:** The folder exists but is not a git repo. Use **Repo Manager** to fix this."
-                    )
-                    return
-
                 try:
                     # Capture base commit for drift detection
+                    # (also tells us whether the folder is a git repo)
                     base_commit = get_remote_branch_head(
                         context.repo_path,
                         context.base_branch
                     )
                     context.base_commit = base_commit
                 except Exception as e:
+                    if isinstance(e, GitCommandError) and is_not_repo_error(e):
+                        st.error(
+                            f"❌ Invalid git repository at: `{context.repo_path}`\n\n"
+                            "👉 **Action Required:** The folder exists but is not a git repo. Use **Repo Manager** to fix this."
+                        )
+                        return
+
                     st.error(
                         f"❌ Failed to verify remote branch status.\n\n"
                         f"**Error Details:** `{str(e)}`\n\n"
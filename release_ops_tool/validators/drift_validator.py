@@ -4,6 +4,9 @@ from pathlib import Path
 import subprocess
 import hashlib
 import json
+import locale
+
+from services.git_service import GitCatFile, clear_remote_head_cache, get_cat_file
 
 class DriftReadError(Exception):
     """Raised when approved file cannot be read from remote branch."""
@@ -21,6 +24,7 @@ def _hash_content(content: str) -> str:
 
 
 def _git_fetch(repo_path: Path) -> None:
+    clear_remote_head_cache(repo_path)
     subprocess.run(
         ["git", "fetch"],
         cwd=repo_path,
@@ -32,7 +36,7 @@ def _git_fetch(repo_path: Path) -> None:
 
 
 def _git_show_file(
-    repo_path: Path,
+    cat_file: GitCatFile,
     branch: str,
     file_path: str
 ) -> str | None:
@@ -40,25 +44,16 @@ def _git_show_file(
     Read file content directly from remote branch.
     Returns None if file doesn't exist in remote (new file).
     """
-    cmd = [
-        "git",
-        "show",
-        f"origin/{branch}:{file_path}"
-    ]
-
-    result = subprocess.run(
-        cmd,
-        cwd=repo_path,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
+    result = cat_file.read(f"origin/{branch}:{file_path}")
 
-    if result.returncode != 0:
+    if result is None:
         # File doesn't exist in remote branch (new file being added)
         return None
 
-    return result.stdout
+    # Decode the way `git show` output read in text mode was decoded,
+    # so hashes stay comparable with existing approvals
+    content = result[1].decode(locale.getpreferredencoding(False))
+    return content.replace("\r\n", "\n").replace("\r", "\n")
 
 
 def validate_no_drift(
@@ -91,9 +86,12 @@ def validate_no_drift(
     status_map = {}
     drifted_files = []
 
+    # One cat-file process serves every approved file
+    cat_file = get_cat_file(repo_path)
+
     for rel_path, approved_hash in approved_files.items():
         remote_content = _git_show_file(
-            repo_path=repo_path,
+            cat_file=cat_file,
             branch=base_branch,
             file_path=rel_path
         )